@@ -1,9 +1,35 @@
 """
 Agents module for Singapore Kopitiam project.
+
+Importing the agents is cheap: they import langchain (and llm.py imports
+httpx) inside the functions that make LLM calls, and their shared clients
+are only built when first needed. So the CLI reaches its first prompt
+without loading langchain_openai. Call preload() to warm those imports in
+the background meanwhile.
 """
 
+import importlib
+import threading
+
 from .coordinator import coordinator
 from .participant import participant
 from .summarizer import summarizer
+from .llm import get_llm, record_usage, usage_report
+
+
+# Heavy modules the agents import on their first call
+_LLM_MODULES = ('langchain_openai', 'langchain.schema')
+
+__all__ = ['coordinator', 'participant', 'summarizer', 'get_llm', 'record_usage', 'usage_report', 'preload']
+
+
+def preload():
+    """
+    Import the LLM client libraries on a background thread, e.g. while
+    waiting for the user's first message.
+    """
+    def load():
+        for module in _LLM_MODULES:
+            importlib.import_module(module)
 
-__all__ = ['coordinator', 'participant', 'summarizer']
\ No newline at end of file
+    threading.Thread(target=load, name="agents-preload", daemon=True).start()
@@ -0,0 +1,170 @@
+"""
+Conversation context for the agents' prompts.
+
+Instead of the whole history, each agent gets its last few messages verbatim
+plus its own rolling summary of everything before them, within a token
+budget of its own. Summaries are updated incrementally on a background
+thread: each update folds only the messages that have left the agent's
+window into its previous summary, so it is never recomputed from scratch
+and never delays a turn.
+"""
+
+import threading
+
+from state import Transcript, conversation_text
+from utils import debug
+
+
+# Agent -> (messages kept verbatim, token budget for the conversation in its prompt)
+CONTEXT_LIMITS = {
+    "coordinator": (8, 1000),
+    "participant": (12, 2500)
+}
+DEFAULT_LIMITS = (10, 2000)
+
+CHARS_PER_TOKEN = 4  # Rough average for English text
+
+SUMMARY_MODEL = "gpt-5-nano"
+SUMMARY_WORDS = 150
+SUMMARY_BATCH = 4  # Messages to wait for before folding them in; until then they stay verbatim
+
+SUMMARY_PROMPT = """You keep running notes on a conversation at a Singapore kopitiam.
+Update the notes with the new lines below. Keep who said what, topics, facts
+mentioned (time, weather, news) and the mood. Reply with the updated notes
+only, at most {words} words.
+
+Notes so far:
+{summary}
+
+New lines:
+{lines}"""
+
+
+def estimate_tokens(text):
+    """
+    Rough token count: about CHARS_PER_TOKEN characters per token.
+    """
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+class RollingSummary:
+    """
+    Summary of the first `count` messages of the conversation, extended in
+    the background as messages leave an agent's window.
+    """
+
+    def __init__(self):
+        self.latest = ("", 0)  # (summary text, messages folded into it), replaced as a whole
+        self._updating = threading.Lock()  # One update in flight at a time
+        self._generation = 0  # Bumped by reset(), so updates started before it are dropped
+        self._lock = threading.Lock()  # Guards latest and _generation together
+
+    def reset(self):
+        with self._lock:
+            self._generation += 1
+            self.latest = ("", 0)
+
+    def update_in_background(self, messages, upto):
+        """
+        Start folding messages[count:upto] into the summary, once there are
+        SUMMARY_BATCH of them and no update is already running.
+        """
+        with self._lock:
+            (text, count), generation = self.latest, self._generation
+        if upto - count < SUMMARY_BATCH or not self._updating.acquire(blocking=False):
+            return
+
+        new_messages = messages[count:upto]
+
+        def update():
+            try:
+                self._fold(text, new_messages, upto, generation)
+            except Exception as e:
+                debug(f"Summary update failed: {e}", "CONTEXT")
+            finally:
+                self._updating.release()
+
+        threading.Thread(target=update, name="rolling-summary", daemon=True).start()
+
+    def _fold(self, previous, new_messages, upto, generation):
+        from langchain.schema import HumanMessage
+        from .llm import get_llm, record_usage
+
+        prompt = SUMMARY_PROMPT.format(
+            words=SUMMARY_WORDS,
+            summary=previous or "(none yet)",
+            lines=conversation_text(new_messages)
+        )
+        response = get_llm(SUMMARY_MODEL, temperature=1).invoke([HumanMessage(content=prompt)])
+        record_usage("rolling summary", response)
+        if isinstance(response.content, list):
+            text = " ".join(str(item) for item in response.content).strip()
+        else:
+            text = str(response.content).strip()
+
+        with self._lock:
+            if generation != self._generation:
+                debug("Dropping a summary of the previous conversation", "CONTEXT")
+                return
+            self.latest = (text, upto)
+        debug(f"Summary now covers {upto} messages", "CONTEXT")
+
+
+# Agent -> its RollingSummary. Each agent's summary ends where its own window
+# starts, so no message is both summarized and repeated verbatim.
+_summaries = {}
+
+
+def summary_for(agent):
+    """
+    Returns the agent's rolling summary, creating it on first use.
+    """
+    summary = _summaries.get(agent)
+    if summary is None:
+        summary = _summaries.setdefault(agent, RollingSummary())
+    return summary
+
+
+def build_context(messages, agent, window=None, budget=None):
+    """
+    Returns the conversation to put in an agent's prompt: the rolling summary
+    of older messages followed by the most recent messages verbatim.
+
+    Args:
+        messages: Transcript (or list of message dicts) of the conversation
+        agent: Agent name, for its CONTEXT_LIMITS
+        window: Messages to keep verbatim (default from CONTEXT_LIMITS)
+        budget: Token budget for the returned text (default from CONTEXT_LIMITS)
+
+    Returns: The context text
+    """
+    default_window, default_budget = CONTEXT_LIMITS.get(agent, DEFAULT_LIMITS)
+    window = default_window if window is None else window
+    budget = default_budget if budget is None else budget
+
+    if not isinstance(messages, Transcript):
+        messages = Transcript(messages)
+
+    summary = summary_for(agent)
+    if len(messages) < summary.latest[1]:
+        summary.reset()  # A new conversation
+
+    # Messages that left the window get folded into the summary for later turns
+    window_start = max(len(messages) - window, 0)
+    summary.update_in_background(messages, window_start)
+
+    # Until the summary catches up, keep the messages it doesn't cover yet
+    summary_text, summary_count = summary.latest
+    start = min(window_start, summary_count) if summary_text else 0
+    header = f"Earlier in the conversation (summary): {summary_text}\n\n" if summary_text else ""
+
+    # Drop the oldest verbatim messages while over budget, keeping the latest
+    # one. The start moves SUMMARY_BATCH messages at a time rather than one per
+    # turn, so consecutive prompts keep sharing a cacheable prefix
+    available = budget - estimate_tokens(header)
+    fit = messages.fit_start(available * CHARS_PER_TOKEN, start)
+    if fit > start:
+        steps = -(-(fit - start) // SUMMARY_BATCH)  # Rounded up, so the text still fits
+        start = min(start + steps * SUMMARY_BATCH, len(messages) - 1)
+
+    return header + messages.text_since(start)
@@ -1,6 +1,6 @@
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
 from utils import debug
+from .context import build_context
+from .llm import get_llm, record_usage
 
 
 def coordinator(state):
@@ -26,12 +26,8 @@ def coordinator(state):
             "volley_msg_left": 0
         }
 
-    messages = state.get("messages", [])
-
-    conversation_text = ""
-    for msg in messages:
-        # Messages are now always dicts
-        conversation_text += f"{msg.get('content', '')}\n"
+    # Recent messages plus a rolling summary of older ones, within the coordinator's budget
+    conversation = build_context(state.get("messages", []), "coordinator")
 
     system_prompt = """You are managing a lively conversation at a Singapore kopitiam.
 
@@ -53,7 +49,7 @@ def coordinator(state):
     """
 
     user_prompt = f"""Recent conversation:
-{conversation_text}
+{conversation}
 
 Who should speak next to keep this kopitiam conversation lively?"""
 
@@ -61,12 +57,15 @@ Who should speak next to keep this kopitiam conversation lively?"""
 
     # Call LLM
     try:
-        llm = ChatOpenAI(model="gpt-5-nano", temperature=1)
+        from langchain.schema import HumanMessage, SystemMessage
+
+        llm = get_llm("gpt-5-nano", temperature=1)
 
         response = llm.invoke([
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ])
+        record_usage("coordinator", response)
 
         # Extract speaker from response
         if isinstance(response.content, list):
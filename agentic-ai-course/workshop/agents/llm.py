@@ -0,0 +1,119 @@
+"""
+Shared LLM clients for the agents.
+
+get_llm() returns one ChatOpenAI per (model, temperature), built on first use
+and kept for the rest of the process. They all send requests over one pooled
+httpx.Client, so every agent turn reuses kept-alive connections to the API
+instead of building a client and a connection each time.
+
+record_usage() tallies prompt tokens per agent, and how many of them the
+provider served from its prompt cache; usage_report() summarizes them.
+"""
+
+import threading
+
+from utils import debug
+
+
+MAX_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 60.0  # Seconds; long enough to span a human's turn
+
+_clients = {}  # (model, temperature) -> ChatOpenAI
+_http_client = None
+_lock = threading.Lock()
+
+_usage = {}  # agent -> [calls, calls with cached tokens, prompt tokens, cached tokens]
+_usage_lock = threading.Lock()
+
+
+def _shared_http_client():
+    global _http_client
+
+    if _http_client is None:
+        import httpx
+
+        _http_client = httpx.Client(
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY
+            )
+        )
+    return _http_client
+
+
+def get_llm(model, temperature=1):
+    """
+    Returns the shared ChatOpenAI for a model and temperature, creating it
+    on first use. Safe to call from several threads.
+    """
+    key = (model, temperature)
+    llm = _clients.get(key)
+    if llm is not None:
+        return llm
+
+    with _lock:
+        llm = _clients.get(key)
+        if llm is None:
+            from langchain_openai import ChatOpenAI
+
+            llm = _clients[key] = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                http_client=_shared_http_client()
+            )
+    return llm
+
+
+def clear():
+    """
+    Drop all clients and close their connections, e.g. after changing
+    OPENAI_API_KEY or OPENAI_BASE_URL. The next get_llm() builds new ones.
+    """
+    global _http_client
+
+    with _lock:
+        _clients.clear()
+        http_client, _http_client = _http_client, None
+    if http_client is not None:
+        http_client.close()
+
+
+def record_usage(agent, response):
+    """
+    Add an LLM response's token usage to the agent's totals.
+
+    Args:
+        agent: Name to report the usage under
+        response: The AIMessage returned by invoke()
+    """
+    metadata = getattr(response, "usage_metadata", None) or {}
+    prompt_tokens = metadata.get("input_tokens", 0)
+    cached_tokens = (metadata.get("input_token_details") or {}).get("cache_read") or 0
+
+    with _usage_lock:
+        totals = _usage.setdefault(agent, [0, 0, 0, 0])
+        totals[0] += 1
+        totals[1] += cached_tokens > 0
+        totals[2] += prompt_tokens
+        totals[3] += cached_tokens
+    debug(f"{agent}: {prompt_tokens} prompt tokens, {cached_tokens} from cache", "USAGE")
+
+
+def usage_report():
+    """
+    Returns one line per agent with its prompt tokens, the share served from
+    the provider's prompt cache, and how many calls hit the cache at all.
+    """
+    with _usage_lock:
+        usage = {agent: list(totals) for agent, totals in _usage.items()}
+
+    lines = []
+    for agent, (calls, hits, prompt_tokens, cached_tokens) in sorted(usage.items()):
+        share = cached_tokens / prompt_tokens if prompt_tokens else 0.0
+        lines.append(
+            f"{agent}: {calls} calls, {prompt_tokens} prompt tokens, "
+            f"{cached_tokens} cached ({share:.0%}), cache hits on {hits}/{calls} calls"
+        )
+    return "\n".join(lines) or "No LLM calls yet"
@@ -1,8 +1,29 @@
-from tools import singapore_time, singapore_weather, singapore_news
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
+import tools
 from utils import debug
+from .context import build_context
+from .llm import get_llm, record_usage
+from concurrent.futures import ThreadPoolExecutor
+import os
 import re
+import sys
+import time
+
+
+DEFAULT_TOOL_TIMEOUT = 10.0  # Seconds
+MAX_PARALLEL_TOOLS = 8
+
+# Tool name -> (function, timeout in seconds). The functions look their tool
+# up on call, so only the tools actually used get imported.
+TOOLS = {
+    "time": (lambda: tools.singapore_time(), 2.0),
+    "weather": (lambda: tools.singapore_weather(), 12.0),  # Allows for WEATHER_DEADLINE
+    "news": (lambda: tools.singapore_news(), 8.0)
+}
+
+# Every tool named on an Action line, e.g. "Action: time" or "Action: time, weather"
+ACTION_PATTERN = re.compile(r'Action:\s*(\w+(?:\s*,\s*\w+)*)')
+
+_tool_pool = None  # Shared across turns, created on first use
 
 
 # Persona configurations
@@ -42,53 +63,15 @@ PERSONAS = {
 }
 
 
-def execute_tool(tool_name):
-    """
-    Execute a specific tool and return its output.
-    Returns Tool output as string
-    """
-    tool_name = tool_name.lower().strip()
-
-    if tool_name == "time":
-        return singapore_time()
-    elif tool_name == "weather":
-        return singapore_weather()
-    elif tool_name == "news":
-        return singapore_news()
-    else:
-        return f"Unknown tool: {tool_name}"
-
-
-def participant(persona_id, state) -> dict:
-    """
-    Generate speech for a persona using ReAct workflow with real tool calling.
-
-    Args:
-        persona_id: One of "ah_seng", "mei_qi", "bala", "dr_tan"
-        state: Current conversation state
-
-    Returns:
-        Dict with message updates for state
-    """
-    if persona_id not in PERSONAS:
-        return {"messages": [{"role": "assistant", "content": f"Unknown persona: {persona_id}"}]}
-
-    persona = PERSONAS[persona_id]
-    debug(f"\n=== {persona['name']} is thinking... ===")
-
-    # Get recent conversation for context
-    messages = state.get("messages", [])
-    conversation_text = ""
-    for msg in messages: 
-        conversation_text += f"{msg.get('content', '')}\n"
-
-    # System prompt for ReAct
-    system_prompt = f"""You are {persona['name']}, {persona['age']} years old.
-Background: {persona['backstory']}
-Personality: {persona['personality']}
-Speech style: {persona['speech_style']}
-
-You are at a Singapore kopitiam having a casual conversation.
+# ReAct instructions shared by every persona: the whole system prompt. A
+# turn's prompt is laid out stable-first (see turn_prompt), so every persona
+# and every call shares one prefix the provider can cache.
+#
+# Limitation: OpenAI only caches prompts whose shared prefix is at least 1024
+# tokens, and these instructions are about 430. Calls are only cached once the
+# instructions, rolling summary and verbatim window together pass that, i.e.
+# in longer conversations; short chats are never served from the cache.
+REACT_INSTRUCTIONS = """You are at a Singapore kopitiam having a casual conversation.
 
 You run in a loop of Thought, Action, Observation.
 At the end of the loop you output a Message.
@@ -125,25 +108,173 @@ Message: [Your response in character]
 
 IMPORTANT:
 - You can use multiple actions by continuing the loop
+- To use several actions at once, write one Action line for each; all their Observations come back together
 - You must not be providing Observation in your response. Observation is a result from tool, not for you to respond.
 - Once you have enough information, output Message: followed by your response
 - Keep your Message concise (1-2 sentences) and in character
 """
 
-    # Internal loop for ReAct
+
+def build_persona_prompt(persona):
+    """
+    Returns the static description of who a persona is.
+    """
+    return sys.intern(f"""------
+
+You are {persona['name']}, {persona['age']} years old.
+Background: {persona['backstory']}
+Personality: {persona['personality']}
+Speech style: {persona['speech_style']}
+""")
+
+
+# Persona ID -> persona description, built once
+PERSONA_PROMPTS = {persona_id: build_persona_prompt(persona) for persona_id, persona in PERSONAS.items()}
+
+
+def turn_prompt(persona_id, conversation):
+    """
+    Returns the user message that starts a persona's turn. The conversation
+    comes before the persona, so prompts for every persona share the system
+    prompt and the conversation up to its newest messages; only the tail
+    differs.
+    """
+    persona = PERSONAS[persona_id]
+    return (
+        f"Recent conversation:\n{conversation}\n\n"
+        f"{PERSONA_PROMPTS[persona_id]}\n"
+        f"Continue the conversation as {persona['name']}.\n"
+    )
+
+
+def execute_tool(tool_name):
+    """
+    Execute a specific tool and return its output.
+    Returns Tool output: a ToolResult (str() gives its text), or a string for an unknown tool
+    """
+    tool_name = tool_name.lower().strip()
+
+    # Answer from the background prefetcher when it has a fresh result
+    result = tools.prefetched(tool_name)
+    if result is not None:
+        debug(f"Serving prefetched {tool_name}")
+        return result
+
+    if tool_name not in TOOLS:
+        return f"Unknown tool: {tool_name}"
+    return TOOLS[tool_name][0]()
+
+
+def register_tool(name, func, timeout=DEFAULT_TOOL_TIMEOUT):
+    """
+    Add or replace a tool that personas can call with "Action: <name>".
+
+    Args:
+        name: Tool name, as the LLM writes it
+        func: Function taking no arguments and returning the observation
+        timeout: Seconds to wait for it before reporting a timeout
+    """
+    TOOLS[name.lower()] = (func, timeout)
+
+
+def parse_actions(content):
+    """
+    Returns the tool names of every Action in an LLM response, in order and
+    without duplicates.
+    """
+    names = []
+    for match in ACTION_PATTERN.finditer(content):
+        for name in match.group(1).split(","):
+            name = name.strip().lower()
+            if name not in names:
+                names.append(name)
+    return names
+
+
+def submit_tool(tool_name):
+    """
+    Start executing a tool on the shared tool pool.
+
+    Returns: (future, start time) to pass to tool_observation()
+    """
+    global _tool_pool
+
+    if _tool_pool is None:
+        _tool_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOLS, thread_name_prefix="tool")
+    return _tool_pool.submit(execute_tool, tool_name), time.monotonic()
+
+
+def tool_observation(tool_name, submitted):
+    """
+    Wait for a submitted tool until its timeout, counted from when it was
+    submitted.
+
+    Returns: The tool's output, or an observation saying it failed or timed out
+    """
+    future, start = submitted
+    timeout = TOOLS.get(tool_name, (None, DEFAULT_TOOL_TIMEOUT))[1]
+    try:
+        return future.result(max(0.0, start + timeout - time.monotonic()))
+    except TimeoutError:
+        return f"{tool_name} timed out after {timeout:g}s"
+    except Exception as e:
+        return f"{tool_name} failed: {e}"
+
+
+def execute_tools(tool_names):
+    """
+    Execute several tools concurrently, each under its own timeout.
+
+    Returns: List of observations, in the order of tool_names. A tool that
+    fails or times out gets an observation saying so.
+    """
+    submitted = [submit_tool(name) for name in tool_names]
+    return [tool_observation(name, job) for name, job in zip(tool_names, submitted)]
+
+
+def participant(persona_id, state) -> dict:
+    """
+    Generate speech for a persona using ReAct workflow with real tool calling.
+    With PARTICIPANT_ENGINE=tools, uses native function calling instead
+    (see tool_calling.py).
+
+    Args:
+        persona_id: One of "ah_seng", "mei_qi", "bala", "dr_tan"
+        state: Current conversation state
+
+    Returns:
+        Dict with message updates for state
+    """
+    if persona_id not in PERSONAS:
+        return {"messages": [{"role": "assistant", "content": f"Unknown persona: {persona_id}"}]}
+
+    if os.getenv("PARTICIPANT_ENGINE", "react").lower() == "tools":
+        from .tool_calling import tool_calling_participant
+        return tool_calling_participant(persona_id, state)
+
+    persona = PERSONAS[persona_id]
+    debug(f"\n=== {persona['name']} is thinking... ===")
+
+    # Get recent conversation for context, with older turns summarized
+    conversation = build_context(state.get("messages", []), "participant")
+
+    from langchain.schema import AIMessage, HumanMessage, SystemMessage
+
+    # Internal loop for ReAct. Each step is appended as new messages, so every
+    # call starts with the same prefix as the one before it
     max_iterations = 5  # Prevent infinite loops
-    internal_context = f"Recent conversation:\n{conversation_text}\n\nContinue the conversation as {persona['name']}.\n"
+    react_messages = [
+        SystemMessage(content=REACT_INSTRUCTIONS),
+        HumanMessage(content=turn_prompt(persona_id, conversation))
+    ]
 
     for iteration in range(max_iterations):
-        user_prompt = internal_context
         debug(f"Iteration {iteration + 1}/{max_iterations}")
 
         try:
-            llm = ChatOpenAI(model="gpt-5-mini", temperature=1)
-            response = llm.invoke([
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ])
+            llm = get_llm("gpt-5-mini", temperature=1)
+            response = llm.invoke(react_messages)
+            record_usage("participant", response)
             content = response.content.strip()
             debug(f"LLM Response:\n{content}\n")
 
@@ -167,23 +298,26 @@ IMPORTANT:
 
             # Check if the response contains Action:
             if "Action:" in content:
-                # Extract the action
-                action_match = re.search(r'Action:\s*(\w+)', content)
-                if action_match:
-                    tool_name = action_match.group(1)
-                    debug(f"Executing tool: {tool_name}")
-
-                    # Execute the tool
-                    observation = execute_tool(tool_name)
-                    debug(f"Observation: {observation}")
+                # Extract every action
+                tool_names = parse_actions(content)
+                if tool_names:
+                    debug(f"Executing tools: {', '.join(tool_names)}")
+
+                    # Execute the tools concurrently
+                    observations = execute_tools(tool_names)
+                    for observation in observations:
+                        debug(f"Observation: {observation}")
                     debug("")  # Empty line for readability
 
-                    # Add observation to internal context
-                    internal_context += f"\n{content}\n\nObservation: {observation}\n"
+                    # Add the step and all its observations to the conversation
+                    react_messages.append(AIMessage(content=content))
+                    react_messages.append(HumanMessage(
+                        content="".join(f"Observation: {observation}\n" for observation in observations)
+                    ))
                     continue
 
             # If we get here without action or message, add to context and continue
-            internal_context += f"\n{content}\n"
+            react_messages.append(AIMessage(content=content))
 
         except Exception as e:
             # Fallback response if LLM fails
@@ -1,5 +1,5 @@
-from langchain_openai import ChatOpenAI
-from langchain.schema import HumanMessage, SystemMessage
+from state import conversation_text
+from .llm import get_llm, record_usage
 
 
 def summarizer(state) -> str:
@@ -18,12 +18,9 @@ def summarizer(state) -> str:
         return "No conversation to summarize."
 
     # Extract conversation text
-    conversation_text = ""
-    for msg in messages:
-        # Messages are now always dicts
-        conversation_text += f"{msg.get('content', '')}\n"
+    conversation = conversation_text(messages)
 
-    if not conversation_text.strip():
+    if not conversation.strip():
         return "No conversation content to summarize."
 
     # System prompt for summarization
@@ -40,18 +37,21 @@ Keep it concise but insightful."""
 
     user_prompt = f"""Here's the conversation that took place:
 
-{conversation_text}
+{conversation}
 
 Please provide a summary of this kopitiam conversation."""
 
     try:
         # Call LLM
-        llm = ChatOpenAI(model="gpt-5-nano", temperature=1)
+        from langchain.schema import HumanMessage, SystemMessage
+
+        llm = get_llm("gpt-5-nano", temperature=1)
 
         response = llm.invoke([
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ])
+        record_usage("summarizer", response)
 
         if isinstance(response.content, list):
             summary = " ".join(str(item) for item in response.content).strip()
@@ -0,0 +1,152 @@
+"""
+Native tool-calling engine for the participant (PARTICIPANT_ENGINE=tools).
+
+Instead of parsing Action:/Message: lines out of free text, each persona's
+allowed tools (PERSONAS[...]["tools"]) are bound to the model as functions.
+The model asks for all the tools it needs in one response, and they run in
+parallel. Responses are streamed, so each tool starts as soon as its call
+shows up in the stream instead of after the whole response. A message
+typically takes two LLM calls: one for the tool calls, one for the reply.
+"""
+
+from utils import debug
+from .context import build_context
+from .llm import get_llm, record_usage
+from .participant import PERSONAS, submit_tool, tool_observation, turn_prompt
+
+
+MODEL = "gpt-5-mini"
+MAX_ROUNDS = 3  # LLM calls per message; the last one must reply rather than call tools
+
+TOOL_DESCRIPTIONS = {
+    "time": "Returns current time in Singapore",
+    "weather": "Returns current weather in Singapore",
+    "news": "Returns latest Singapore news"
+}
+
+INSTRUCTIONS = """You are at a Singapore kopitiam having a casual conversation.
+
+You have tools that return the current time, weather and news in Singapore.
+Never guess those: call the tool. If you need more than one, call them all at
+once.
+
+Reply with your next message in the conversation only, without your name in
+front. Keep it concise (1-2 sentences) and in character."""
+
+
+def tool_schema(tool_name):
+    """
+    Returns the OpenAI function definition for a tool. The tools take no arguments.
+    """
+    return {
+        "type": "function",
+        "function": {
+            "name": tool_name,
+            "description": TOOL_DESCRIPTIONS.get(tool_name, f"Runs the {tool_name} tool"),
+            "parameters": {"type": "object", "properties": {}}
+        }
+    }
+
+
+# Persona ID -> function definitions of its allowed tools
+TOOL_SCHEMAS = {
+    persona_id: [tool_schema(tool_name) for tool_name in persona["tools"]]
+    for persona_id, persona in PERSONAS.items()
+}
+
+
+def _stream_round(llm, messages, allowed_tools):
+    """
+    Stream one response, starting each requested tool as soon as its name
+    arrives.
+
+    Returns: (the whole response message, {tool name: submitted tool})
+    """
+    response = None
+    started = {}
+    for chunk in llm.stream(messages, stream_usage=True):
+        response = chunk if response is None else response + chunk
+        for call in chunk.tool_call_chunks:
+            tool_name = call.get("name")
+            if tool_name in allowed_tools and tool_name not in started:
+                debug(f"Executing tool: {tool_name}")
+                started[tool_name] = submit_tool(tool_name)
+    return response, started
+
+
+def tool_calling_participant(persona_id, state) -> dict:
+    """
+    Generate speech for a persona using native tool calling.
+
+    Args:
+        persona_id: One of "ah_seng", "mei_qi", "bala", "dr_tan"
+        state: Current conversation state
+
+    Returns:
+        Dict with message updates for state
+    """
+    from langchain.schema import HumanMessage, SystemMessage
+    from langchain_core.messages import ToolMessage
+
+    persona = PERSONAS[persona_id]
+    debug(f"\n=== {persona['name']} is thinking (tool calling)... ===")
+
+    conversation = build_context(state.get("messages", []), "participant")
+    messages = [
+        SystemMessage(content=INSTRUCTIONS),  # Shared by every persona, see participant.turn_prompt
+        HumanMessage(content=turn_prompt(persona_id, conversation))
+    ]
+    allowed_tools = set(persona["tools"])
+
+    for round_number in range(MAX_ROUNDS):
+        last_round = round_number == MAX_ROUNDS - 1
+
+        try:
+            llm = get_llm(MODEL, temperature=1).bind_tools(
+                TOOL_SCHEMAS[persona_id],
+                tool_choice="none" if last_round else "auto",
+                parallel_tool_calls=True
+            )
+            response, started = _stream_round(llm, messages, allowed_tools)
+            record_usage("participant", response)
+        except Exception as e:
+            debug(f"LLM error: {e}")
+            return {
+                "messages": [{
+                    "role": "assistant",
+                    "name": persona['name'],
+                    "content": f"{persona['name']}: Sorry ah, my mind a bit blur now..."
+                }]
+            }
+
+        if not response.tool_calls:
+            final_message = str(response.content).strip()
+            debug(f"Final Message: {final_message}")
+            debug(f"=== End of {persona['name']}'s thought process ===\n")
+            return {
+                "messages": [{
+                    "role": "assistant",
+                    "name": persona['name'],
+                    "content": f"\n{persona['name']}: {final_message}\n\n"
+                }]
+            }
+
+        # Answer every tool call; the tools have been running since they were streamed
+        messages.append(response)
+        for call in response.tool_calls:
+            tool_name = call["name"]
+            if tool_name in started:
+                observation = tool_observation(tool_name, started[tool_name])
+            else:
+                observation = f"Unknown tool: {tool_name}"
+            debug(f"Observation: {observation}")
+            messages.append(ToolMessage(content=str(observation), tool_call_id=call["id"]))
+
+    # Unreachable unless the model ignores tool_choice="none"
+    return {
+        "messages": [{
+            "role": "assistant",
+            "name": persona['name'],
+            "content": f"{persona['name']}: Well, that's interesting lah..."
+        }]
+    }
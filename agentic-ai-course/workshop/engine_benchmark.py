@@ -0,0 +1,219 @@
+"""
+Participant engine benchmark: text ReAct vs native tool calling.
+
+Starts a local fake OpenAI-compatible server and has every persona speak
+once per round with each engine, using all of its tools:
+
+- react, one action per step: the text ReAct loop, with the model asking for
+  one tool per response as it usually does
+- react, all actions in one step: the same loop, with every Action line in
+  the first response
+- tools: PARTICIPANT_ENGINE=tools, streamed parallel function calls
+
+It reports LLM calls per message, prompt tokens sent per message and wall
+time per message. The fake server takes --latency-ms per LLM call, half of
+it before the first streamed chunk and the rest spread over the chunks, and
+each tool takes --tool-ms.
+
+    python engine_benchmark.py
+    python engine_benchmark.py --rounds 5 --latency-ms 800 --tool-ms 300
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+
+import agents
+from agents import llm as llm_registry
+from llm_benchmark import FakeOpenAIHandler
+
+
+class FakeEngineHandler(FakeOpenAIHandler):
+    """
+    Answers participant calls for both engines, after a simulated model
+    latency. With tools in the request, asks for all of them at once, then
+    replies once they have all been answered; streams when asked to.
+    """
+
+    latency = 0.0
+    react_batched = False
+    persona_tools = {}  # Persona name -> tool names, to fake ReAct steps
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        messages = request["messages"]
+        full_prompt = "".join(f"{message['role']}: {message.get('content') or ''}\n" for message in messages)
+        prompt_tokens = (len(full_prompt) + len(json.dumps(request.get("tools", "")))) // 4  # Tool definitions count too
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": 10,
+            "total_tokens": prompt_tokens + 10,
+            "prompt_tokens_details": {"cached_tokens": self.cached_tokens(full_prompt)}
+        }
+
+        tool_calls = []
+        if "tools" in request:
+            if messages[-1]["role"] != "tool" and request.get("tool_choice") != "none":
+                tool_calls = [tool["function"]["name"] for tool in request["tools"]]
+            content = "" if tool_calls else "Statistically speaking, this is a fine afternoon."
+        else:
+            content = self.react_step(messages)
+
+        if request.get("stream"):
+            self.stream(request["model"], content, tool_calls, usage)
+        else:
+            time.sleep(self.latency)
+            self.respond(request["model"], content, usage)
+
+    def react_step(self, messages):
+        persona = next(name for name in self.persona_tools if f"You are {name}," in messages[1]["content"])
+        tools = self.persona_tools[persona]
+        done = sum(message["content"].count("Observation:") for message in messages[2:] if message["role"] == "user")
+        if done >= len(tools):
+            return "Message: Statistically speaking, this is a fine afternoon."
+        if self.react_batched:
+            return "Thought: I should check everything\n" + "".join(f"Action: {name}\n" for name in tools)
+        return f"Thought: I should check the {tools[done]}\nAction: {tools[done]}"
+
+    def respond(self, model, content, usage):
+        body = json.dumps({
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": usage
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream(self, model, content, tool_calls, usage):
+        deltas = [{"role": "assistant", "content": ""}]
+        for index, name in enumerate(tool_calls):
+            deltas.append({"tool_calls": [{
+                "index": index,
+                "id": f"call_{index}",
+                "type": "function",
+                "function": {"name": name, "arguments": ""}
+            }]})
+            deltas.append({"tool_calls": [{"index": index, "function": {"arguments": "{}"}}]})
+        deltas.extend({"content": word} for word in content.split(" ") if word)
+
+        def event(delta, finish_reason=None):
+            choices = [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if delta is not None else []
+            return {"id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": int(time.time()),
+                    "model": model, "choices": choices, **({} if delta is not None else {"usage": usage})}
+
+        events = [event(delta) for delta in deltas]
+        events.append(event({}, "tool_calls" if tool_calls else "stop"))
+        events.append(event(None))  # Usage, as requested by stream_options
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        time.sleep(self.latency / 2)  # Time to first token
+        pause = self.latency / 2 / len(events)
+        for payload in events:
+            self.write_chunk(f"data: {json.dumps(payload)}\n\n")
+            time.sleep(pause)
+        self.write_chunk("data: [DONE]\n\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def write_chunk(self, text):
+        data = text.encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+
+def stub_tool(name, seconds):
+    def tool():
+        time.sleep(seconds)
+        return f"{name}: fine"
+    return tool
+
+
+def speak(persona_ids, rounds):
+    """
+    Returns (LLM calls, prompt tokens, seconds) for each message.
+    """
+    participant = agents.participant
+    state = {"messages": [{"role": "user", "content": "You: Eh, how's everything today?"}]}
+    measurements = []
+    for _ in range(rounds):
+        for persona_id in persona_ids:
+            llm_registry._usage.clear()
+            start = time.perf_counter()
+            result = participant(persona_id, state)
+            elapsed = time.perf_counter() - start
+            assert "Statistically" in result["messages"][0]["content"], result
+
+            calls, _, prompt_tokens, _ = llm_registry._usage["participant"]
+            measurements.append((calls, prompt_tokens, elapsed))
+    return measurements
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the participant engines")
+    parser.add_argument("--rounds", type=int, default=3, help="Messages per persona and engine")
+    parser.add_argument("--latency-ms", type=float, default=400.0, help="Fake model time per LLM call")
+    parser.add_argument("--tool-ms", type=float, default=150.0, help="Time each stub tool takes")
+    args = parser.parse_args()
+
+    participant_module = sys.modules["agents.participant"]  # agents.participant is the function
+
+    FakeEngineHandler.latency = args.latency_ms / 1000
+    FakeEngineHandler.persona_tools = {
+        persona["name"]: persona["tools"] for persona in participant_module.PERSONAS.values()
+    }
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeEngineHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["OPENAI_API_KEY"] = "fake"
+    os.environ["PREFETCH_TOOLS"] = "false"
+
+    for name in ("time", "weather", "news"):
+        participant_module.register_tool(name, stub_tool(name, args.tool_ms / 1000))
+
+    persona_ids = list(participant_module.PERSONAS)
+    engines = [
+        ("react, one action per step", "react", False),
+        ("react, all actions in one step", "react", True),
+        ("tools (streamed, parallel)", "tools", False)
+    ]
+
+    print(f"{args.rounds} messages per persona, {args.latency_ms:.0f}ms per LLM call, "
+          f"{args.tool_ms:.0f}ms per tool\n")
+    for label, engine, batched in engines:
+        os.environ["PARTICIPANT_ENGINE"] = engine
+        FakeEngineHandler.react_batched = batched
+        speak(persona_ids[:1], 1)  # Warm up imports and the connection pool
+        measurements = speak(persona_ids, args.rounds)
+
+        calls, prompt_tokens, seconds = zip(*measurements)
+        print(f"{label:32s} {statistics.mean(calls):4.2f} LLM calls, "
+              f"{statistics.mean(prompt_tokens):6.0f} prompt tokens, "
+              f"{statistics.mean(seconds) * 1000:6.0f}ms per message")
+
+    llm_registry.clear()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
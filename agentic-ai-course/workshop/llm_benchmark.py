@@ -0,0 +1,223 @@
+"""
+LLM client benchmark: shared ChatOpenAI registry vs a new client per call.
+
+Starts a local fake OpenAI-compatible server and plays conversation turns
+against it. Each turn is one coordinator call plus a participant that asks
+for the time and then speaks (two LLM calls). Three ways of getting the LLM
+client are compared:
+
+- new ChatOpenAI per call: what the agents used to do. Recent langchain-openai
+  versions cache their default HTTP client, so connections are still reused
+- new ChatOpenAI and HTTP client per call: how that code behaves on older
+  langchain-openai versions, which built a new HTTP client every time
+- shared registry: agents.llm.get_llm
+
+The fake server delays each new connection by --handshake-ms to stand in for
+the TCP + TLS setup to the real API. It also reports prompt caching the way
+OpenAI does (the longest prefix shared with an earlier prompt, from
+--cache-min-tokens, 1024 on OpenAI, in 128-token steps), so a final longer
+conversation shows how much of the agents' prompts a provider could serve
+from its cache. The fake lines are short; --reply-words makes them as long as
+real ones, which is when prompts get past the cache minimum.
+
+    python llm_benchmark.py
+    python llm_benchmark.py --turns 20 --handshake-ms 80
+    python llm_benchmark.py --reply-words 40
+"""
+
+import argparse
+import itertools
+import json
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import agents
+from agents import llm as llm_registry
+from state import Transcript
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """
+    Answers /v1/chat/completions like the agents' real LLM calls would: a
+    speaker ID for the coordinator, an Action and then a Message for the
+    participant, and notes for the rolling summary.
+    """
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    handshake = 0.0
+    cache_min_tokens = 1024
+    reply_words = 0  # Extra words in each participant message, for realistic line lengths
+    seen_prompts = []  # Earlier prompts, for the emulated prefix cache
+    speakers = itertools.cycle(["bala", "dr_tan", "mei_qi", "ah_seng"])  # Speakers take turns, as in a real chat
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        time.sleep(self.handshake)  # Once per connection, not per request
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = request["messages"][-1]["content"]
+        full_prompt = "".join(f"{message['role']}: {message['content']}\n" for message in request["messages"])
+        prompt_tokens = len(full_prompt) // 4
+        cached_tokens = self.cached_tokens(full_prompt)
+
+        if "Who should speak next" in prompt:
+            content = next(self.speakers)
+        elif "running notes" in prompt:
+            content = "Notes: the regulars chatted about the time."
+        elif "Observation:" in prompt:
+            content = "Message: Statistically speaking, this is a fine afternoon." + " lah" * self.reply_words
+        else:
+            content = "Thought: I should check the time\nAction: time"
+
+        body = json.dumps({
+            "id": "chatcmpl-fake",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop"
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": 10,
+                "total_tokens": prompt_tokens + 10,
+                "prompt_tokens_details": {"cached_tokens": cached_tokens}
+            }
+        }).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def cached_tokens(self, prompt):
+        longest = 0
+        for earlier in self.seen_prompts[-64:]:
+            longest = max(longest, common_prefix_length(earlier, prompt))
+        self.seen_prompts.append(prompt)
+
+        tokens = longest // 4
+        return tokens // 128 * 128 if tokens >= self.cache_min_tokens else 0
+
+    def log_message(self, format, *args):
+        pass
+
+
+def common_prefix_length(a, b):
+    # Binary search with slice comparisons, which run in C
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if a[:middle] == b[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def per_call_llm(own_http_client):
+    """
+    Returns a get_llm replacement that builds a new client on every call.
+    """
+    from langchain_openai import ChatOpenAI
+    import httpx
+
+    def get_llm(model, temperature=1):
+        if own_http_client:
+            return ChatOpenAI(model=model, temperature=temperature, http_client=httpx.Client())
+        return ChatOpenAI(model=model, temperature=temperature)
+
+    return get_llm
+
+
+def use_get_llm(get_llm):
+    for module in ("agents.coordinator", "agents.participant", "agents.summarizer"):
+        sys.modules[module].get_llm = get_llm
+
+
+def play_turns(turns):
+    """
+    Returns the seconds taken by each turn.
+    """
+    timings = []
+    state = {"messages": [{"role": "user", "content": "You: Eh, what time now?"}], "volley_msg_left": 5}
+    for _ in range(turns):
+        start = time.perf_counter()
+        update = agents.coordinator(state)
+        result = agents.participant(update["next_speaker"], state)
+        timings.append(time.perf_counter() - start)
+        assert "Statistically" in result["messages"][0]["content"], result
+    return timings
+
+
+def play_conversation(turns):
+    """
+    Play turns on a growing transcript, as in a real chat.
+    """
+    messages = Transcript([{"role": "user", "content": "You: Eh, what time now? " + "Tell me everything lah. " * 20}])
+    for turn in range(turns):
+        update = agents.coordinator({"messages": messages, "volley_msg_left": 5})
+        result = agents.participant(update["next_speaker"], {"messages": messages})
+        messages = messages.extended(result["messages"])
+        if turn % 5 == 4:
+            messages = messages.extended([{"role": "user", "content": f"You: And then? ({turn})"}])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared LLM client registry")
+    parser.add_argument("--turns", type=int, default=10, help="Turns per mode")
+    parser.add_argument("--handshake-ms", type=float, default=40.0, help="Fake server delay per new connection")
+    parser.add_argument("--cache-min-tokens", type=int, default=1024, help="Shortest prefix the fake server caches")
+    parser.add_argument("--reply-words", type=int, default=0, help="Extra words in each participant message")
+    args = parser.parse_args()
+
+    FakeOpenAIHandler.handshake = args.handshake_ms / 1000
+    FakeOpenAIHandler.cache_min_tokens = args.cache_min_tokens
+    FakeOpenAIHandler.reply_words = args.reply_words
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeOpenAIHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}/v1"
+    os.environ["OPENAI_API_KEY"] = "fake"
+    os.environ["PREFETCH_TOOLS"] = "false"
+
+    modes = [
+        ("new ChatOpenAI per call", per_call_llm(False)),
+        ("new ChatOpenAI and HTTP client per call", per_call_llm(True)),
+        ("shared registry", llm_registry.get_llm)
+    ]
+
+    print(f"{args.turns} turns per mode (3 LLM calls each), "
+          f"{args.handshake_ms:.0f}ms per new connection\n")
+    for label, get_llm in modes:
+        use_get_llm(get_llm)
+        llm_registry.clear()
+        play_turns(1)  # Warm up imports, and the pool where there is one
+        timings = play_turns(args.turns)
+        print(f"{label:40s} median {statistics.median(timings) * 1000:6.1f}ms per turn, "
+              f"mean {statistics.mean(timings) * 1000:6.1f}ms")
+
+    print(f"\nPrompt caching over a {args.turns * 3}-turn conversation (shared registry):")
+    FakeOpenAIHandler.seen_prompts.clear()
+    llm_registry._usage.clear()
+    play_conversation(args.turns * 3)
+    time.sleep(0.5)  # Let the last rolling summary update finish
+    print(llm_registry.usage_report())
+
+    llm_registry.clear()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 from dotenv import load_dotenv
 from langgraph.graph import StateGraph, START, END
 
-from state import State
-from agents import coordinator
+from state import State, Transcript
+from agents import coordinator, preload, usage_report
+from tools import prefetcher_from_env
+from utils import debug
 from nodes import (
     human_node,
     check_exit_condition,
@@ -65,16 +67,23 @@ def main():
     print("Mei Qi with her phone, Bala checking football scores,")
     print("and Dr. Tan sipping his kopi-o.\n")
 
+    # Start warming news and weather while the user types their first message
+    prefetcher = prefetcher_from_env()
+    if prefetcher is not None:
+        prefetcher.start()
+
     graph = build_graph()
 
     print(graph.get_graph().draw_ascii())
 
     initial_state = State(
-        messages=[],
+        messages=Transcript(),
         volley_msg_left=0,
         next_speaker=None
     )
 
+    preload()  # Import the LLM client in the background while the user types
+
     try:
         graph.invoke(initial_state)
     except KeyboardInterrupt:
@@ -82,6 +91,10 @@ def main():
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         print("Ending conversation...")
+    finally:
+        if prefetcher is not None:
+            prefetcher.stop()
+        debug(f"Token usage:\n{usage_report()}", "USAGE")
 
 
 if __name__ == "__main__":
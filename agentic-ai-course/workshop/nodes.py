@@ -14,12 +14,9 @@ def human_node(state: State) -> dict:
         "content": f"You: {user_input}"
     }
 
-    # Copy existing messages and append the new one
-    messages = state.get("messages", []).copy()
-    messages.append(human_message)
-
+    # Return only the new message; State's reducer appends it to the transcript
     return {
-        "messages": messages,
+        "messages": [human_message],
         "volley_msg_left": 5
     }
 
@@ -60,14 +57,12 @@ def participant_node(state: State) -> dict:
     # Call participant with the selected speaker
     result = participant(next_speaker, state)
 
-    # Print and return messages
+    # Print and return the new messages
     if result and "messages" in result:
-        messages = state.get("messages", []).copy()
         for msg in result["messages"]:
             print(msg.get("content", ""))
-            messages.append(msg)
 
-        return {"messages": messages}
+        return {"messages": result["messages"]}
 
     return {}
 
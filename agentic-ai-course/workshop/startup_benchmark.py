@@ -0,0 +1,96 @@
+"""
+Startup benchmark: time from launching main.py to the first "You:" prompt.
+
+Runs main.py in a subprocess (no LLM or network calls are made before the
+prompt), then reruns it under `python -X importtime` to list the imports
+that cost the most.
+
+    python startup_benchmark.py                  # 5 runs plus the import breakdown
+    python startup_benchmark.py --max-seconds 2  # also fail if the median is slower
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+PROMPT = b"You:"
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def time_to_prompt(*python_args):
+    """
+    Launch main.py and return (seconds until the first prompt, stderr text).
+    """
+    env = dict(os.environ, PYTHONUNBUFFERED="1", PREFETCH_TOOLS="false", DEBUG="false")
+
+    # stderr goes to a file: -X importtime writes more than a pipe buffer holds
+    with tempfile.TemporaryFile() as stderr:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, *python_args, "main.py"],
+            cwd=HERE, env=env,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=stderr
+        )
+
+        output = b""
+        while PROMPT not in output:
+            chunk = os.read(process.stdout.fileno(), 4096)
+            if not chunk:
+                break
+            output += chunk
+        elapsed = time.perf_counter() - start
+
+        process.kill()
+        process.communicate()
+        stderr.seek(0)
+        log = stderr.read().decode(errors="replace")
+
+    if PROMPT not in output:
+        raise RuntimeError(f"main.py exited before prompting:\n{log}")
+    return elapsed, log
+
+
+def slowest_imports(importtime_log, limit):
+    """
+    Returns the `limit` top-level imports with the largest cumulative time,
+    as (microseconds, module) pairs.
+    """
+    imports = []
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # Nested imports count towards their parent
+            imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to list")
+    parser.add_argument("--max-seconds", type=float, help="Exit with an error above this median")
+    args = parser.parse_args()
+
+    times = [time_to_prompt()[0] for _ in range(args.runs)]
+    median = statistics.median(times)
+    print(f"Time to first prompt: median {median:.2f}s, "
+          f"min {min(times):.2f}s, max {max(times):.2f}s over {args.runs} runs")
+
+    _, log = time_to_prompt("-X", "importtime")
+    print("\nSlowest top-level imports before the prompt:")
+    for microseconds, module in slowest_imports(log, args.top):
+        print(f"  {microseconds / 1e6:6.3f}s  {module}")
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"\nFAIL: median {median:.2f}s is over {args.max_seconds:.2f}s")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
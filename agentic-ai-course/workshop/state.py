@@ -1,10 +1,172 @@
-from typing import TypedDict, Optional
+import bisect
+import itertools
+from typing import Annotated, TypedDict, Optional
+
+
+class _TranscriptStore:
+    """
+    Messages and their rendered text, shared by every Transcript that
+    extends the same history.
+    """
+
+    __slots__ = ('messages', 'offsets', 'parts', 'length', '_joined')
+
+    def __init__(self):
+        self.messages = []
+        self.offsets = []  # offsets[i] is where message i starts in the full text
+        self.parts = []  # parts[i] is message i rendered
+        self.length = 0  # Length of the full text
+        self._joined = (0, "")  # (count, full text of the first count messages), from the last full read
+
+    def extend(self, messages):
+        for message in messages:
+            part = f"{message.get('content', '')}\n"
+            self.messages.append(message)
+            self.offsets.append(self.length)
+            self.parts.append(part)
+            self.length += len(part)
+
+    def join(self, start, stop):
+        """
+        Returns the text of messages[start:stop], joining only those parts.
+        The latest full text (start 0) is kept for repeated reads.
+        """
+        if start > 0:
+            return "".join(self.parts[start:stop])
+
+        count, text = self._joined
+        if count != stop:
+            text = "".join(self.parts[:stop])
+            self._joined = (stop, text)
+        return text
+
+    def end(self, count):
+        """
+        Returns where the text of the first `count` messages ends.
+        """
+        return self.offsets[count] if count < len(self.messages) else self.length
+
+    def copy(self, count):
+        store = _TranscriptStore()
+        store.extend(self.messages[:count])
+        return store
+
+
+class Transcript:
+    """
+    Immutable, append-only conversation history that keeps each message
+    rendered (its content on its own line), so agents can read recent
+    messages without re-rendering or copying the whole history.
+
+    extended() returns a new Transcript in O(new messages): transcripts
+    share one store of messages and rendered text, and each one sees only
+    its first `count` messages. Extending an older transcript again copies
+    the store, unless it is being extended with the very messages that
+    follow it already (as LangGraph does when it previews an update before
+    applying it).
+    """
+
+    __slots__ = ('_store', '_count')
+
+    def __init__(self, messages=()):
+        self._store = _TranscriptStore()
+        self._store.extend(messages)
+        self._count = len(self._store.messages)
+
+    @classmethod
+    def _view(cls, store, count):
+        transcript = cls.__new__(cls)
+        transcript._store = store
+        transcript._count = count
+        return transcript
+
+    def extended(self, messages):
+        """
+        Returns a new Transcript with `messages` appended.
+        """
+        messages = list(messages)
+        store, count = self._store, self._count
+        following = store.messages[count:count + len(messages)]
+
+        if len(following) == len(messages) and all(a is b for a, b in zip(following, messages)):
+            return self._view(store, count + len(messages))
+        if count < len(store.messages):
+            store = store.copy(count)  # Branching from an older history
+        store.extend(messages)
+        return self._view(store, count + len(messages))
+
+    @property
+    def text(self):
+        """
+        The rendered conversation. This joins the whole history, so agents
+        that only need recent messages should use text_since(); repeated reads
+        of the same transcript return the same string.
+        """
+        return self._store.join(0, self._count)
+
+    def text_since(self, index):
+        """
+        The rendered conversation from message `index` on (negative counts
+        from the end, like list indexing). Costs only the messages returned.
+        """
+        if index < 0:
+            index = max(index + self._count, 0)
+        if index >= self._count:
+            return ""
+        return self._store.join(index, self._count)
+
+    def fit_start(self, chars, start=0):
+        """
+        Returns the first index from `start` on whose text_since() is at most
+        `chars` characters long, or the last message's index when even that
+        one alone is longer. A binary search over the message offsets.
+        """
+        last = max(self._count - 1, start)
+        end = self._store.end(self._count)
+        return bisect.bisect_left(self._store.offsets, end - chars, start, last)
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return itertools.islice(self._store.messages, self._count)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._store.messages[i] for i in range(self._count)[index]]
+        return self._store.messages[range(self._count)[index]]
+
+    def __repr__(self):
+        return f"Transcript({self._count} messages)"
+
+
+def append_messages(transcript, new_messages):
+    """
+    LangGraph reducer for State["messages"]: nodes return only their new
+    messages, which are appended to the transcript. A Transcript (such as
+    the initial state's) replaces it instead.
+    """
+    if isinstance(new_messages, Transcript):
+        return new_messages
+    if not isinstance(transcript, Transcript):
+        transcript = Transcript(transcript or ())
+    return transcript.extended(new_messages)
+
+
+def conversation_text(messages):
+    """
+    Returns the rendered conversation for a Transcript or a plain list of
+    message dicts.
+    """
+    if isinstance(messages, Transcript):
+        return messages.text
+    return "".join(f"{msg.get('content', '')}\n" for msg in messages)
 
 
 class State(TypedDict):
     """
     Overall state of the entire LangGraph system.
     """
-    messages: list  # Simple list of message dicts
+    messages: Annotated[Transcript, append_messages]  # Nodes return only new message dicts
     volley_msg_left: int
     next_speaker: Optional[str]
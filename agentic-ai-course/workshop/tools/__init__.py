@@ -1,10 +1,21 @@
 """
 Tools module for Singapore Kopitiam project.
+
+Importing it stays cheap: the network tools import http_client (and with it
+httpx) only when they first make a request.
 """
 
-from .singapore_time import singapore_time
-from .singapore_weather import singapore_weather
-from .singapore_news import singapore_news
+from .results import ToolResult
+from .singapore_time import singapore_time, singapore_now, SingaporeTime, TimeResult
+from .singapore_weather import singapore_weather, WeatherResult
+from .singapore_news import singapore_news, NewsResult, NewsItem
+from .prefetch import ToolPrefetcher, prefetched, prefetcher_from_env
 from .test import test_print_all
 
-__all__ = ['singapore_time', 'singapore_weather', 'singapore_news', 'test_print_all']
+__all__ = [
+    'singapore_time', 'singapore_now', 'SingaporeTime', 'TimeResult',
+    'singapore_weather', 'WeatherResult',
+    'singapore_news', 'NewsResult', 'NewsItem',
+    'ToolResult', 'ToolPrefetcher', 'prefetched', 'prefetcher_from_env',
+    'test_print_all'
+]
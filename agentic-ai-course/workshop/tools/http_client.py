@@ -0,0 +1,192 @@
+"""
+Shared HTTP clients for the kopitiam tools.
+
+Every tool goes through one pooled httpx.Client (and one AsyncClient per
+event loop), so repeated calls reuse kept-alive connections instead of
+paying for a new TCP + TLS handshake each time. Requests get the same
+default timeouts, at most MAX_CONNECTIONS_PER_HOST connections per host,
+and are retried with exponential backoff on connection errors and
+RETRY_STATUSES.
+"""
+
+import asyncio
+import random
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+import httpx
+
+
+USER_AGENT = "sgkopitiam/0.1"
+TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+MAX_CONNECTIONS = 20
+MAX_CONNECTIONS_PER_HOST = 6
+KEEPALIVE_EXPIRY = 30.0
+
+RETRIES = 2  # Retries after the first attempt
+BACKOFF = 0.25  # Seconds before the first retry, doubled for each one after
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_client = None
+_client_lock = threading.Lock()
+_host_slots = {}  # host -> BoundedSemaphore
+_async_pools = weakref.WeakKeyDictionary()  # event loop -> (AsyncClient, {host: Semaphore})
+
+
+def _new_client(client_class):
+    return client_class(
+        headers={"User-Agent": USER_AGENT},
+        timeout=TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY
+        )
+    )
+
+
+def get_client():
+    """
+    Returns the process-wide httpx.Client, creating it on first use.
+    """
+    global _client
+
+    client = _client
+    if client is None or client.is_closed:
+        with _client_lock:
+            if _client is None or _client.is_closed:
+                _client = _new_client(httpx.Client)
+            client = _client
+    return client
+
+
+def get_async_client():
+    """
+    Returns the running event loop's httpx.AsyncClient, creating it on first use.
+    """
+    return _async_pool()[0]
+
+
+def close():
+    """
+    Close the shared client. The next request opens a new one.
+    """
+    global _client
+
+    with _client_lock:
+        client, _client = _client, None
+    if client is not None:
+        client.close()
+
+
+async def aclose():
+    """
+    Close the running event loop's shared async client.
+    """
+    pool = _async_pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool[0].aclose()
+
+
+def _backoff(attempt):
+    # Jitter keeps concurrent callers from retrying in lockstep
+    return BACKOFF * 2 ** attempt * random.uniform(0.5, 1.0)
+
+
+def _host_slot(url):
+    host = urlsplit(str(url)).netloc
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots.setdefault(host, threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST))
+    return slot
+
+
+def _should_retry(response, attempt, retries):
+    return response.status_code in RETRY_STATUSES and attempt < retries
+
+
+def request(method, url, retries=RETRIES, **kwargs):
+    """
+    Send a request on the shared client, retrying with backoff.
+
+    Args:
+        method: HTTP method, e.g. "GET"
+        url: URL to request
+        retries: Retries after the first attempt
+        **kwargs: Passed to httpx.Client.request, e.g. params, headers, timeout
+
+    Returns: The httpx.Response of the last attempt
+    """
+    client = get_client()
+    for attempt in range(retries + 1):
+        try:
+            with _host_slot(url):
+                response = client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+        else:
+            if not _should_retry(response, attempt, retries):
+                return response
+        time.sleep(_backoff(attempt))
+
+
+@contextmanager
+def stream(method, url, retries=RETRIES, **kwargs):
+    """
+    Like request(), but yields the response before its body is read, so it
+    can be consumed incrementally. Only getting the response is retried.
+    """
+    client = get_client()
+    with _host_slot(url):
+        for attempt in range(retries + 1):
+            try:
+                response = client.send(client.build_request(method, url, **kwargs), stream=True)
+            except httpx.TransportError:
+                if attempt == retries:
+                    raise
+            else:
+                if not _should_retry(response, attempt, retries):
+                    break
+                response.close()
+            time.sleep(_backoff(attempt))
+
+        try:
+            yield response
+        finally:
+            response.close()
+
+
+def _async_pool():
+    loop = asyncio.get_running_loop()
+    pool = _async_pools.get(loop)
+    if pool is None or pool[0].is_closed:
+        pool = _async_pools[loop] = (_new_client(httpx.AsyncClient), {})
+    return pool
+
+
+async def arequest(method, url, retries=RETRIES, **kwargs):
+    """
+    Async version of request(), on the running event loop's shared client.
+    """
+    client, slots = _async_pool()
+    host = urlsplit(str(url)).netloc
+    slot = slots.get(host)
+    if slot is None:
+        slot = slots[host] = asyncio.Semaphore(MAX_CONNECTIONS_PER_HOST)
+
+    for attempt in range(retries + 1):
+        try:
+            async with slot:
+                response = await client.request(method, url, **kwargs)
+        except httpx.TransportError:
+            if attempt == retries:
+                raise
+        else:
+            if not _should_retry(response, attempt, retries):
+                return response
+        await asyncio.sleep(_backoff(attempt))
@@ -0,0 +1,145 @@
+import os
+import threading
+import time
+
+from utils import debug
+
+
+# Seconds between background refreshes of each tool; override with
+# NEWS_REFRESH_SECONDS / WEATHER_REFRESH_SECONDS
+REFRESH_INTERVALS = {
+    "news": 300,
+    "weather": 120
+}
+
+# Results older than this are not served; the tool is called directly instead.
+# Override with PREFETCH_MAX_AGE
+MAX_AGE = 900
+
+_active = None  # The running ToolPrefetcher, if any
+
+
+class ToolPrefetcher:
+    """
+    Keeps the latest results of the slow network tools warm on a background
+    thread, so a persona's tool call can be answered from memory.
+
+    Args:
+        intervals: Tool name -> seconds between refreshes (default REFRESH_INTERVALS)
+        max_age: Seconds after which a result is too stale to serve (default MAX_AGE)
+    """
+
+    def __init__(self, intervals=None, max_age=MAX_AGE):
+        self.tools = None  # Tool name -> function, resolved on the refresh thread
+        self.intervals = dict(REFRESH_INTERVALS if intervals is None else intervals)
+        self.max_age = max_age
+
+        self._results = {}  # tool name -> (fetched_at, result)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        global _active
+
+        if self._thread is not None:
+            return self
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="tool-prefetcher", daemon=True)
+        self._thread.start()
+        _active = self
+        debug("Tool prefetcher started", "PREFETCH")
+        return self
+
+    def stop(self, timeout=5.0):
+        """
+        Stop refreshing and wait for an in-progress refresh to finish.
+        """
+        global _active
+
+        if _active is self:
+            _active = None
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+        debug("Tool prefetcher stopped", "PREFETCH")
+
+    def get(self, tool_name):
+        """
+        Returns the prefetched result for a tool, or None if there is none
+        fresh enough to serve.
+        """
+        entry = self._results.get(tool_name)
+        if entry is None:
+            return None
+
+        fetched_at, result = entry
+        if time.monotonic() - fetched_at > self.max_age:
+            return None
+        return result
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        if self.tools is None:
+            self.tools = _default_tools()
+        next_due = {name: 0.0 for name in self.tools if name in self.intervals}
+
+        while not self._stop.is_set():
+            for name, due in next_due.items():
+                if self._stop.is_set():
+                    return
+                if time.monotonic() >= due:
+                    self._refresh(name)
+                    next_due[name] = time.monotonic() + self.intervals[name]
+
+            if not next_due:
+                return
+            self._stop.wait(max(0.0, min(next_due.values()) - time.monotonic()))
+
+    def _refresh(self, name):
+        try:
+            self._results[name] = (time.monotonic(), self.tools[name]())
+            debug(f"Refreshed {name}", "PREFETCH")
+        except Exception as e:
+            debug(f"Failed to refresh {name}: {e}", "PREFETCH")
+
+
+def _default_tools():
+    from . import singapore_news, singapore_weather
+    return {
+        "news": singapore_news,
+        "weather": singapore_weather
+    }
+
+
+def prefetched(tool_name):
+    """
+    Returns the running prefetcher's result for a tool, or None.
+    """
+    prefetcher = _active
+    if prefetcher is None:
+        return None
+    return prefetcher.get(tool_name)
+
+
+def prefetcher_from_env():
+    """
+    Build a ToolPrefetcher configured from environment variables, or return
+    None unless PREFETCH_TOOLS is set to "true" (prefetching is opt-in).
+    """
+    if os.getenv("PREFETCH_TOOLS", "false").lower() != "true":
+        return None
+
+    intervals = {
+        name: float(os.getenv(f"{name.upper()}_REFRESH_SECONDS", seconds))
+        for name, seconds in REFRESH_INTERVALS.items()
+    }
+    return ToolPrefetcher(intervals, float(os.getenv("PREFETCH_MAX_AGE", MAX_AGE)))
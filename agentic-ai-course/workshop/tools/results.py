@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class ToolResult:
+    """
+    Immutable result of a tool call. Subclasses hold the structured data and
+    implement render(); str() renders once and reuses the text after that,
+    so the observation, logs and caches all share one string.
+    """
+
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def render(self) -> str:
+        raise NotImplementedError
+
+    def __str__(self):
+        text = self._text
+        if text is None:
+            text = self.render()
+            object.__setattr__(self, "_text", text)  # Frozen, but the cache may be filled in
+        return text
@@ -1,75 +1,126 @@
-import httpx
-from bs4 import BeautifulSoup, Tag
+import html
+import re
+import threading
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass
 
+from .results import ToolResult
 
-def singapore_news() -> str:
+
+FEED_URL = "https://mothership.sg/feed/"
+NEWS_LIMIT = 10
+
+_TAG = re.compile(r"<[^>]+>")
+
+# Last parsed feed, with the validators needed to ask "has it changed?"
+_feed = {"etag": None, "last_modified": None, "items": None}
+_feed_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class NewsItem:
+    title: str
+    snippet: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class NewsResult(ToolResult):
+    items: tuple  # NewsItem, newest first
+    fallback: bool = False  # True when the feed couldn't be read and canned news was used
+
+    def render(self) -> str:
+        lines = ["Latest Singapore news:", ""]
+        for i, item in enumerate(self.items, 1):
+            lines.append(f"{i}. {item.title}")
+            if item.snippet:
+                lines.append(f"   {item.snippet}")
+            lines.append("")
+        return "\n".join(lines).strip()
+
+
+# Served if the feed has never been read successfully
+FALLBACK_NEWS = (
+    NewsItem("Local kopitiam wins best kopi award", "Traditional coffee-making skills recognized nationally"),
+    NewsItem("New MRT line to connect heartlands", "Enhanced connectivity for residential areas"),
+    NewsItem("Singapore weather: Monsoon season expected", "Heavy rains forecasted for the coming weeks")
+)
+
+
+def strip_html(snippet):
     """
-    Returns the latest Singapore news from Mothership.sg RSS feed.
-    Fetches article titles and descriptions from the RSS feed.
+    Remove HTML tags and entities from an RSS description.
+    """
+    return html.unescape(_TAG.sub("", snippet)).strip()
+
+
+def parse_items(chunks, limit=NEWS_LIMIT):
+    """
+    Incrementally parse RSS items from an iterable of byte chunks, stopping
+    (and so reading no further) once `limit` items have been found.
     """
+    parser = ET.XMLPullParser(events=("end",))
+    news_items = []
 
-    result = "Latest Singapore news:\n\n"
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag != "item":
+                continue
 
+            title = (elem.findtext("title") or "").strip()
+            snippet = strip_html(elem.findtext("description") or "")
+            elem.clear()  # Parsed items aren't needed in the tree
+
+            if title:
+                news_items.append(NewsItem(title, snippet))
+                if len(news_items) >= limit:
+                    return tuple(news_items)
+
+    return tuple(news_items)
+
+
+def fetch_news_items():
+    """
+    Returns the latest news items. Uses a conditional GET, so an unchanged
+    feed is answered with 304 Not Modified and served from the last parse.
+    """
+    from . import http_client  # Loads httpx, so only on the first request
+
+    with _feed_lock:
+        headers = {}
+        if _feed["items"] is not None:
+            if _feed["etag"]:
+                headers["If-None-Match"] = _feed["etag"]
+            if _feed["last_modified"]:
+                headers["If-Modified-Since"] = _feed["last_modified"]
+
+        with http_client.stream("GET", FEED_URL, headers=headers, timeout=2.0) as response:
+            if response.status_code == 304 and _feed["items"] is not None:
+                return _feed["items"]
+
+            response.raise_for_status()
+            news_items = parse_items(response.iter_bytes())
+
+        _feed.update(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            items=news_items
+        )
+        return news_items
+
+
+def singapore_news() -> NewsResult:
+    """
+    Returns the latest Singapore news from Mothership.sg RSS feed.
+    Fetches article titles and descriptions from the RSS feed.
+    """
     try:
-        # Add timeout back and debug
-        response = httpx.get("https://mothership.sg/feed/", timeout=2.0)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "xml")
-
-        items = soup.find_all("item", limit=10)
-
-        if items:
-            news_items = []
-            for item in items:
-                try:
-                    # Ensure item is a Tag
-                    if not isinstance(item, Tag):
-                        continue
-
-                    # Extract title
-                    title_elem = item.find("title")
-                    title = title_elem.text.strip() if title_elem else ""
-
-                    # Extract description/snippet
-                    desc_elem = item.find("description")
-                    snippet = desc_elem.text.strip() if desc_elem else ""
-
-                    # Clean snippet - remove HTML if any
-                    if snippet:
-                        # Parse snippet to remove any HTML tags
-                        snippet_soup = BeautifulSoup(snippet, "html.parser")
-                        snippet = snippet_soup.get_text().strip()
-
-                    if title:
-                        news_items.append({
-                            "title": title,
-                            "snippet": snippet
-                        })
-
-                except Exception:
-                    continue  # Skip problematic items
-
-            if news_items:
-                for i, item in enumerate(news_items, 1):
-                    result += f"{i}. {item['title']}\n"
-                    if item['snippet']:
-                        result += f"   {item['snippet']}\n"
-                    result += "\n"
-                return result.strip()
-
-    except httpx.TimeoutException:
-        pass
-    except httpx.HTTPError:
-        pass
+        news_items = fetch_news_items()
     except Exception:
-        pass
+        news_items = _feed["items"]  # Last known news beats the canned fallback
+
+    if news_items:
+        return NewsResult(news_items)
 
     # Fallback news if RSS fetch fails
-    result += "1. Local kopitiam wins best kopi award\n"
-    result += "   Traditional coffee-making skills recognized nationally\n\n"
-    result += "2. New MRT line to connect heartlands\n"
-    result += "   Enhanced connectivity for residential areas\n\n"
-    result += "3. Singapore weather: Monsoon season expected\n"
-    result += "   Heavy rains forecasted for the coming weeks"
-    return result
+    return NewsResult(FALLBACK_NEWS, fallback=True)
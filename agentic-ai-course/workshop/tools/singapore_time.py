@@ -1,11 +1,69 @@
-from datetime import datetime
-import pytz
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import NamedTuple
 
+from .results import ToolResult
 
-def singapore_time() -> str:
+
+TIMEZONE_NAME = "Asia/Singapore"
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_formatted = (None, "")  # (whole second, that second in TIME_FORMAT)
+
+
+class SingaporeTime(NamedTuple):
+    now: datetime  # Timezone-aware
+    formatted: str  # now in TIME_FORMAT
+
+
+@dataclass(frozen=True, slots=True)
+class TimeResult(ToolResult):
+    time: SingaporeTime
+
+    def render(self) -> str:
+        return f"Time in Singapore now: {self.time.formatted}"
+
+
+@lru_cache(maxsize=None)
+def singapore_tz():
+    """
+    Returns the Asia/Singapore timezone, resolved once per process.
+    Uses the stdlib zoneinfo, falling back to pytz where no tz database is
+    available (e.g. Windows without the tzdata package), then to a fixed
+    UTC+8 offset, which is exact as Singapore has no daylight saving.
+    """
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(TIMEZONE_NAME)
+    except (ImportError, KeyError):  # ZoneInfoNotFoundError is a KeyError
+        pass
+
+    try:
+        import pytz
+        return pytz.timezone(TIMEZONE_NAME)
+    except ImportError:
+        return timezone(timedelta(hours=8), "SGT")
+
+
+def singapore_now() -> SingaporeTime:
+    """
+    Returns the current time in Singapore, both as a datetime and formatted.
+    The formatted string is reused for calls within the same second.
+    """
+    global _formatted
+
+    now = datetime.now(singapore_tz())
+    second = int(now.timestamp())
+
+    cached = _formatted
+    if cached[0] != second:
+        cached = _formatted = (second, now.strftime(TIME_FORMAT))
+    return SingaporeTime(now, cached[1])
+
+
+def singapore_time() -> TimeResult:
     """
-    Returns the current local time in Singapore as a formatted string.
+    Returns the current local time in Singapore; str() gives the formatted text.
     """
-    singapore_tz = pytz.timezone("Asia/Singapore")
-    singapore_time = datetime.now(singapore_tz)
-    return f"Time in Singapore now: {singapore_time.strftime('%Y-%m-%d %H:%M:%S')}"
+    return TimeResult(singapore_now())
@@ -1,8 +1,15 @@
-import httpx
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from .results import ToolResult
 
 
 PRIMARY_STATION = "S111"  # Scotts Road
-FALLBACK_STATION = "S50"  # Clementi Road
+KOPITIAM_LOCATION = (1.31055, 103.8365)  # Next to S111; other stations are ranked by distance from here
 
 API_ENDPOINTS = {
     "temperature": "https://api-open.data.gov.sg/v2/real-time/api/air-temperature",
@@ -11,6 +18,116 @@ API_ENDPOINTS = {
     "wind_speed": "https://api-open.data.gov.sg/v2/real-time/api/wind-speed"
 }
 
+UNITS = {
+    "temperature": "°C",
+    "humidity": "%",
+    "rainfall": " mm",
+    "wind_speed": " km/h"
+}
+
+# Overall deadline for all four requests, which run concurrently
+WEATHER_DEADLINE = 10.0
+
+# Readings are shared by every caller in the process. NEA publishes a new
+# reading about every UPDATE_INTERVALS seconds, so a response stays fresh
+# until its reading timestamp + interval + PUBLISH_DELAY, clamped to
+# [MIN_TTL, MAX_TTL]. An expired response is still served for STALE_GRACE
+# seconds while a background refresh fetches the next one.
+UPDATE_INTERVALS = {
+    "temperature": 60,
+    "humidity": 60,
+    "rainfall": 300,
+    "wind_speed": 60
+}
+PUBLISH_DELAY = 30
+MIN_TTL = 30
+MAX_TTL = 600
+STALE_GRACE = 900
+
+_readings = {}  # metric -> (expires_at, ReadingSet)
+_locks = {metric: threading.Lock() for metric in API_ENDPOINTS}  # One request in flight per metric
+
+
+class ReadingSet:
+    """
+    One API response, indexed once: the latest value per station and each
+    station's coordinates. Gives O(1) station lookups, aggregates across all
+    stations and a nearest-station fallback.
+    """
+
+    __slots__ = ('timestamp', 'values', 'locations', '_nearest')
+
+    def __init__(self, response_data):
+        data = response_data.get("data") or {}
+        readings = data.get("readings") or []
+        reading = readings[0] if readings else {}
+
+        self.timestamp = reading.get("timestamp")
+        self.values = {}
+        if response_data.get("code") == 0:
+            self.values = {r["stationId"]: r["value"] for r in reading.get("data", [])}
+
+        self.locations = {}
+        for station in data.get("stations", []):
+            location = station.get("location") or {}
+            if "latitude" in location and "longitude" in location:
+                self.locations[station["id"]] = (location["latitude"], location["longitude"])
+
+        self._nearest = {}  # (latitude, longitude) -> stations with readings, nearest first
+
+    def get(self, station):
+        return self.values.get(station)
+
+    def first(self, stations):
+        """
+        Returns the value of the first station in the list that has a reading, or None.
+        """
+        for station in stations:
+            if station in self.values:
+                return self.values[station]
+        return None
+
+    def nearest(self, latitude, longitude):
+        """
+        Returns the IDs of stations with readings and known coordinates,
+        nearest first.
+        """
+        key = (latitude, longitude)
+        if key not in self._nearest:
+            # Equirectangular distance is plenty at Singapore's size and latitude
+            self._nearest[key] = sorted(
+                (station for station in self.values if station in self.locations),
+                key=lambda station: (self.locations[station][0] - latitude) ** 2
+                + (self.locations[station][1] - longitude) ** 2
+            )
+        return self._nearest[key]
+
+    def value_near(self, latitude, longitude, preferred=None):
+        """
+        Returns the preferred station's value if it has a reading, otherwise
+        the value at the nearest station that does, or None.
+        """
+        if preferred in self.values:
+            return self.values[preferred]
+        stations = self.nearest(latitude, longitude)
+        return self.values[stations[0]] if stations else None
+
+    def mean(self):
+        values = self.values.values()
+        return sum(values) / len(values) if values else None
+
+    def min(self):
+        return min(self.values.values(), default=None)
+
+    def max(self):
+        return max(self.values.values(), default=None)
+
+    def total(self):
+        """
+        Sum over all stations, e.g. island-wide rainfall.
+        """
+        return sum(self.values.values())
+
 
 def extract_station_data(response_data, stations):
     """
@@ -22,64 +139,174 @@ def extract_station_data(response_data, stations):
 
     Returns: Value from the first available station, or None
     """
-    if response_data.get("code") != 0:
-        return None
+    return ReadingSet(response_data).first(stations)
 
-    data = response_data.get("data", {})
-    readings = data.get("readings", [])
 
-    if not readings:
-        return None
+def reading_ttl(metric, readings):
+    """
+    Seconds until NEA is expected to publish a newer reading than this one.
+    """
+    try:
+        taken_at = datetime.fromisoformat(readings.timestamp).timestamp()
+    except (TypeError, ValueError):
+        return MIN_TTL
+
+    ttl = taken_at + UPDATE_INTERVALS[metric] + PUBLISH_DELAY - time.time()
+    return min(max(ttl, MIN_TTL), MAX_TTL)
+
+
+def _request_reading(metric):
+    from . import http_client  # Loads httpx, so only on the first request
+
+    response = http_client.request("GET", API_ENDPOINTS[metric], timeout=WEATHER_DEADLINE)
+    response.raise_for_status()
+    readings = ReadingSet(response.json())
+
+    _readings[metric] = (time.time() + reading_ttl(metric, readings), readings)
+    return readings
+
 
-    reading = readings[0]
-    station_reading = reading.get("data", [])
+def _refresh_in_background(metric):
+    lock = _locks[metric]
+    if not lock.acquire(blocking=False):
+        return  # Already being refreshed
 
-    reading_map = {r["stationId"]: r["value"] for r in station_reading}
+    def refresh():
+        try:
+            _request_reading(metric)
+        except Exception:
+            pass  # Keep serving the stale reading
+        finally:
+            lock.release()
 
-    for station in stations:
-        if station in reading_map:
-            return reading_map[station]
+    threading.Thread(target=refresh, daemon=True).start()
 
+
+def cached_reading(metric):
+    """
+    Returns the cached ReadingSet for a metric if it can be used now, or None.
+    A stale one is returned too, after starting a background refresh.
+    """
+    cached = _readings.get(metric)
+    if cached is None:
+        return None
+
+    expires_at, readings = cached
+    now = time.time()
+    if now < expires_at:
+        return readings
+    if now < expires_at + STALE_GRACE:
+        _refresh_in_background(metric)
+        return readings
     return None
 
 
-def singapore_weather() -> str:
+def get_reading(metric):
+    """
+    Returns the latest ReadingSet for a metric, from the cache when possible.
+    Concurrent callers for the same metric wait on one request.
+    """
+    readings = cached_reading(metric)
+    if readings is not None:
+        return readings
+
+    with _locks[metric]:
+        cached = _readings.get(metric)
+        if cached is not None and time.time() < cached[0]:
+            return cached[1]  # Fetched while we waited for the lock
+        return _request_reading(metric)
+
+
+def format_metric(metric, value):
+    """
+    Returns: The value with its unit, or "N/A" if there is no value
+    """
+    if value is None:
+        return "N/A"
+    return f"{value}{UNITS[metric]}"
+
+
+@dataclass(frozen=True, slots=True)
+class WeatherResult(ToolResult):
     """
-    Returns Singapore weather information using NEA's API. For reference we are using weather station: S111: Scotts Road, failing which, we use S50: Clementi.
+    The kopitiam's weather; a value is None when no station had a reading
+    or its request failed.
+    """
+
+    temperature: Optional[float] = None
+    humidity: Optional[float] = None
+    rainfall: Optional[float] = None
+    wind_speed: Optional[float] = None
+
+    def render(self) -> str:
+        return (
+            "Weather in Singapore now:\n"
+            f"Temperature: {format_metric('temperature', self.temperature)}\n"
+            f"Humidity: {format_metric('humidity', self.humidity)}\n"
+            f"Rainfall: {format_metric('rainfall', self.rainfall)}\n"
+            f"Wind Speed: {format_metric('wind_speed', self.wind_speed)}"
+        )
+
+
+def kopitiam_value(readings):
+    """
+    Returns: The value at PRIMARY_STATION, or at the nearest station with a reading
+    """
+    return readings.value_near(*KOPITIAM_LOCATION, preferred=PRIMARY_STATION)
+
+
+def fetch_metric(metric):
+    """
+    Fetch one metric's value at the kopitiam.
+    """
+    return kopitiam_value(get_reading(metric))
+
+
+def singapore_weather() -> WeatherResult:
+    """
+    Returns Singapore weather information using NEA's API. For reference we are using weather station: S111: Scotts Road, failing which, the nearest station with a reading.
     1. Temperature: https://api-open.data.gov.sg/v2/real-time/api/air-temperature
     2. Relative humidity: https://api-open.data.gov.sg/v2/real-time/api/relative-humidity
     3. Rainfall: https://api-open.data.gov.sg/v2/real-time/api/rainfall
     4. Wind: https://api-open.data.gov.sg/v2/real-time/api/wind-speed
+
+    Readings are cached process-wide (see UPDATE_INTERVALS). Metrics not in
+    the cache are fetched concurrently under one WEATHER_DEADLINE; a metric
+    that fails or misses the deadline shows as N/A.
     """
 
     weather_data = {}
-    stations = [PRIMARY_STATION, FALLBACK_STATION]
 
-    with httpx.Client(timeout=10.0) as client:
-        for metric, url in API_ENDPOINTS.items():
-            try:
-                response = client.get(url)
-                response.raise_for_status()
-                data = response.json()
+    for metric in API_ENDPOINTS:
+        readings = cached_reading(metric)
+        if readings is not None:
+            weather_data[metric] = kopitiam_value(readings)
 
-                value = extract_station_data(data, stations)
+    missing = [metric for metric in API_ENDPOINTS if metric not in weather_data]
+    if missing:
+        _fetch_metrics(missing, weather_data)
 
-                if metric == "temperature" and value is not None:
-                    weather_data["temperature"] = f"{value}°C"
-                elif metric == "humidity" and value is not None:
-                    weather_data["humidity"] = f"{value}%"
-                elif metric == "rainfall" and value is not None:
-                    weather_data["rainfall"] = f"{value} mm"
-                elif metric == "wind_speed" and value is not None:
-                    weather_data["wind_speed"] = f"{value} km/h"
+    return WeatherResult(**weather_data)
 
-            except Exception as e:
-                weather_data[metric] = "N/A"
 
-    result = f"Weather in Singapore now:\n"
-    result += f"Temperature: {weather_data.get('temperature', 'N/A')}\n"
-    result += f"Humidity: {weather_data.get('humidity', 'N/A')}\n"
-    result += f"Rainfall: {weather_data.get('rainfall', 'N/A')}\n"
-    result += f"Wind Speed: {weather_data.get('wind_speed', 'N/A')}"
+def _fetch_metrics(metrics, weather_data):
+    """
+    Fetch metrics concurrently into weather_data, leaving out any that fail
+    or miss WEATHER_DEADLINE.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(metrics))
+    try:
+        futures = {
+            executor.submit(fetch_metric, metric): metric
+            for metric in metrics
+        }
+        done, _ = wait(futures, timeout=WEATHER_DEADLINE)
 
-    return result
+        for future in done:
+            try:
+                weather_data[futures[future]] = future.result()
+            except Exception as e:
+                weather_data[futures[future]] = None
+    finally:
+        # Don't wait for metrics that missed the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,156 @@
+"""
+Tool-call benchmark: a shared pooled HTTP client vs a new connection per call.
+
+Serves stand-ins for the NEA weather API and the Mothership RSS feed from a
+local stub server, then replays the tool calls of a 5-volley conversation
+twice: once with a fresh client per tool call (as the tools used to do) and
+once on tools.http_client's shared pool. Tool caches are cleared before every
+call so each one goes to the network. The stub delays each new connection by
+--handshake-ms to stand in for the TCP + TLS setup of a real remote host.
+
+    python tools_benchmark.py
+    python tools_benchmark.py --handshake-ms 80 --rounds 5
+"""
+
+import argparse
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import tools
+from tools import http_client
+
+
+# Tool calls made in each volley of the conversation
+VOLLEYS = [
+    ["weather"],
+    ["news"],
+    ["time", "weather"],
+    ["news"],
+    ["weather", "news"]
+]
+
+STATIONS = ["S111", "S24", "S43"]
+
+
+def weather_response():
+    return json.dumps({
+        "code": 0,
+        "data": {
+            "stations": [
+                {"id": station, "location": {"latitude": 1.3 + i / 100, "longitude": 103.8 + i / 100}}
+                for i, station in enumerate(STATIONS)
+            ],
+            "readings": [{
+                "timestamp": "2025-01-01T12:00:00+08:00",
+                "data": [{"stationId": station, "value": 30.0 + i} for i, station in enumerate(STATIONS)]
+            }]
+        }
+    }).encode()
+
+
+def feed_response(items=20):
+    entries = "".join(
+        f"<item><title>Story {i}</title><description>&lt;p&gt;Snippet {i}&lt;/p&gt;</description></item>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss><channel>{entries}</channel></rss>'.encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    handshake = 0.0
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        time.sleep(self.handshake)  # Once per connection, not per request
+
+    def do_GET(self):
+        if self.path.startswith("/feed"):
+            body, content_type = feed_response(), "application/rss+xml"
+        else:
+            body, content_type = weather_response(), "application/json"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def point_tools_at(base_url):
+    weather = sys.modules["tools.singapore_weather"]
+    news = sys.modules["tools.singapore_news"]
+    for metric in weather.API_ENDPOINTS:
+        weather.API_ENDPOINTS[metric] = f"{base_url}/weather/{metric}"
+    news.FEED_URL = f"{base_url}/feed/"
+
+
+def clear_tool_caches():
+    weather = sys.modules["tools.singapore_weather"]
+    news = sys.modules["tools.singapore_news"]
+    weather._readings.clear()
+    news._feed.update(etag=None, last_modified=None, items=None)
+
+
+def run_conversation(shared):
+    """
+    Returns the seconds spent in each network tool call of one conversation.
+    """
+    functions = {"time": tools.singapore_time, "weather": tools.singapore_weather, "news": tools.singapore_news}
+    timings = []
+    for volley in VOLLEYS:
+        for tool_name in volley:
+            clear_tool_caches()
+            if not shared:
+                http_client.close()  # Next call opens a new client and connections
+            start = time.perf_counter()
+            functions[tool_name]()
+            if tool_name != "time":
+                timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared HTTP client for tool calls")
+    parser.add_argument("--handshake-ms", type=float, default=40.0, help="Stub delay per new connection")
+    parser.add_argument("--rounds", type=int, default=3, help="Conversations per mode")
+    args = parser.parse_args()
+
+    StubHandler.handshake = args.handshake_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # Load the tool modules, then redirect them to the stub
+    tools.singapore_weather, tools.singapore_news
+    point_tools_at(f"http://127.0.0.1:{server.server_address[1]}")
+
+    print(f"{len(VOLLEYS)}-volley conversation, {args.handshake_ms:.0f}ms per new connection, "
+          f"{args.rounds} rounds\n")
+
+    results = {}
+    for label, shared in (("new client per call", False), ("shared pooled client", True)):
+        http_client.close()
+        run_conversation(shared)  # Warm up imports and, when shared, the pool
+        timings = [t for _ in range(args.rounds) for t in run_conversation(shared)]
+        results[label] = sum(timings) / len(timings)
+        print(f"{label:22s} {results[label] * 1000:7.1f}ms per tool call, "
+              f"{results[label] * len(timings) / args.rounds * 1000:7.1f}ms per conversation")
+
+    saved = results["new client per call"] - results["shared pooled client"]
+    print(f"\nSaved {saved * 1000:.1f}ms per network tool call")
+
+    http_client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Async-native version of wikipedia_enhanced.get_article.
+
+Talks to the MediaWiki API directly over a shared, pooled httpx.AsyncClient
+(keep-alive, HTTP/2 when the `h2` package is installed) instead of the
+blocking `wikipedia` package, so it can be awaited from an async agent. Each
+article costs one request: the plain-text extract holds the full content,
+and its lead section is the summary.
+
+    articles = await aget_article("artificial intelligence")
+"""
+
+import asyncio
+import importlib.util
+import re
+import time
+import weakref
+
+import httpx
+
+import wikipedia_enhanced
+
+
+API_URL = "https://en.wikipedia.org/w/api.php"
+USER_AGENT = "wikipedia-enhanced/0.1 (ARCHAAS workshop)"  # Wikimedia asks clients to identify themselves
+DEFAULT_MAX_CONCURRENCY = 8
+REQUEST_TIMEOUT = 10.0
+
+_FIRST_HEADING = re.compile(r"\n+=+ ")
+
+# One client and semaphore per event loop; an AsyncClient can't be shared across loops
+_pools = weakref.WeakKeyDictionary()
+
+
+def _new_client(max_concurrency):
+    return httpx.AsyncClient(
+        headers={"User-Agent": USER_AGENT},
+        timeout=REQUEST_TIMEOUT,
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=max_concurrency,
+            max_keepalive_connections=max_concurrency,
+            keepalive_expiry=30.0
+        )
+    )
+
+
+def _pool(max_concurrency):
+    """
+    Returns the (client, semaphore) pair for the running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None or pool[0].is_closed:
+        pool = _pools[loop] = (_new_client(max_concurrency), asyncio.Semaphore(max_concurrency))
+    return pool
+
+
+async def aclose():
+    """
+    Close the running event loop's shared client.
+    """
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool[0].aclose()
+
+
+def _count(counter):
+    sink = wikipedia_enhanced.metrics
+    if sink is not None:
+        sink.increment(counter)
+
+
+async def _cache_call(method, *args):
+    """
+    Call an article_cache method, on a worker thread when the cache has a
+    SQLite tier so the event loop never waits on disk.
+    """
+    if wikipedia_enhanced.article_cache.path is None:
+        return method(*args)
+    return await asyncio.to_thread(method, *args)
+
+
+async def _query(client, semaphore, span, **params):
+    params.update(action="query", format="json", formatversion=2)
+
+    sink = wikipedia_enhanced.metrics
+    start = time.perf_counter()
+    async with semaphore:
+        response = await client.get(API_URL, params=params)
+    if sink is not None:
+        sink.observe(span, time.perf_counter() - start)
+
+    response.raise_for_status()
+    return response.json()
+
+
+async def _search(client, semaphore, search_term, use_cache):
+    cache = wikipedia_enhanced.article_cache
+    max_results = wikipedia_enhanced.MAX_RESULTS
+
+    if use_cache:
+        results = await _cache_call(cache.get_search, search_term, max_results)
+        _count("cache_hits" if results is not None else "cache_misses")
+        if results is not None:
+            return results
+
+    data = await _query(
+        client, semaphore, "search",
+        list="search", srsearch=search_term, srlimit=max_results, srprop=""
+    )
+    results = [hit["title"] for hit in data.get("query", {}).get("search", [])]
+
+    if use_cache:
+        await _cache_call(cache.put_search, search_term, max_results, results)
+    return results
+
+
+async def _fetch_page(client, semaphore, title, follow_disambiguation=True):
+    """
+    Returns the article dict for a title, or None if it should be skipped.
+    """
+    data = await _query(
+        client, semaphore, "page",
+        prop="extracts|pageprops", titles=title, explaintext=1,
+        ppprop="disambiguation", redirects=1
+    )
+    pages = data.get("query", {}).get("pages", [])
+    if not pages or pages[0].get("missing") or pages[0].get("invalid"):
+        _count("skips")
+        return None
+
+    page = pages[0]
+    if "disambiguation" in page.get("pageprops", {}):
+        # Handle disambiguation pages by taking the first linked article
+        _count("disambiguations")
+        if not follow_disambiguation:
+            return None
+        links = await _query(
+            client, semaphore, "page",
+            prop="links", titles=page["title"], plnamespace=0, pllimit=1
+        )
+        options = links.get("query", {}).get("pages", [{}])[0].get("links", [])
+        if not options:
+            return None
+        return await _fetch_page(client, semaphore, options[0]["title"], False)
+
+    content = page.get("extract", "")
+    return {
+        'title': page["title"],
+        'content': content,
+        'description': _FIRST_HEADING.split(content, 1)[0].strip()  # Lead section, like page.summary
+    }
+
+
+async def aget_article(search_term, max_concurrency=DEFAULT_MAX_CONCURRENCY, timeout=None,
+                       use_cache=True, client=None):
+    """
+    Async version of get_article: returns content, title, and description for
+    the top 3 search results, fetched concurrently over a pooled connection.
+
+    Args:
+        search_term (str): The term to search for on Wikipedia
+        max_concurrency (int): Maximum requests in flight for the shared client
+                               (applies when the client is first created)
+        timeout (float): Deadline in seconds for each article; unfinished
+                         articles are dropped. None waits for all of them.
+        use_cache (bool): Serve and store results through
+                          wikipedia_enhanced.article_cache
+        client (httpx.AsyncClient): Client to use instead of the shared one
+
+    Returns:
+        list: A list of dictionaries containing 'title', 'content', and 'description'
+              for up to 3 Wikipedia articles, in search order
+    """
+    if client is None:
+        client, semaphore = _pool(max_concurrency)
+    else:
+        semaphore = asyncio.Semaphore(max_concurrency)
+    cache = wikipedia_enhanced.article_cache
+
+    try:
+        results = await _search(client, semaphore, search_term, use_cache)
+    except Exception as e:
+        _count("errors")
+        print(f"Error searching Wikipedia: {e}")
+        return []
+
+    async def fetch(result):
+        if use_cache:
+            article = await _cache_call(cache.get_article, result)
+            _count("cache_hits" if article is not None else "cache_misses")
+            if article is not None:
+                return dict(article)  # Never hand out the cache's own dict
+        try:
+            article = await asyncio.wait_for(_fetch_page(client, semaphore, result), timeout)
+        except asyncio.TimeoutError:
+            return None
+        except Exception as e:
+            _count("errors")
+            print(f"Error processing result '{result}': {e}")
+            return None
+        if article is not None and use_cache:
+            await _cache_call(cache.put_article, result, dict(article))
+        return article
+
+    fetched = await asyncio.gather(*(fetch(result) for result in results))
+
+    # Drop missing articles and duplicates of the same canonical title
+    articles = {}
+    for article in fetched:
+        if article is not None:
+            articles.setdefault(article['title'], article)
+    return list(articles.values())
+
+
+# Example usage and testing
+if __name__ == "__main__":
+    async def main():
+        search_term = "artificial intelligence"
+        print(f"Searching for: {search_term}")
+        print("=" * 50)
+
+        articles = await aget_article(search_term)
+        await aclose()
+
+        for i, article in enumerate(articles, 1):
+            print(f"\n--- Article {i} ---")
+            print(f"Title: {article['title']}")
+            print(f"Description: {article['description'][:200]}...")
+            print(f"Content length: {len(article['content'])} characters")
+
+    asyncio.run(main())
@@ -0,0 +1,272 @@
+"""
+Benchmark for wikipedia_enhanced against a local stub of the `wikipedia` module.
+
+The stub simulates network latency for every search, page, content and summary
+request, so the numbers compare request scheduling rather than Wikipedia itself.
+
+The async benchmark instead serves a mock MediaWiki API over local HTTP and
+compares the `wikipedia` package (one connection per request, one request at
+a time) with wikipedia_async's pooled client.
+
+Usage:
+    python wikipedia_benchmark.py
+    python wikipedia_benchmark.py async
+"""
+
+import asyncio
+import json
+import socket
+import sys
+import threading
+import time
+import types
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+LATENCY = 0.05  # Simulated round trip per request, in seconds
+ROUNDS = 5
+BATCH_TERMS = 20
+
+
+class DisambiguationError(Exception):
+    def __init__(self, title, options):
+        super().__init__(f"{title} may refer to: {', '.join(options)}")
+        self.title = title
+        self.options = options
+
+
+class PageError(Exception):
+    pass
+
+
+class StubPage:
+    """
+    Mimics wikipedia.WikipediaPage: content and summary are lazy requests.
+    """
+
+    def __init__(self, backend, title):
+        self.backend = backend
+        self.title = title
+
+    @property
+    def content(self):
+        self.backend.request()
+        return f"{self.title} content. " * 2000
+
+    @property
+    def summary(self):
+        self.backend.request()
+        return f"{self.title} is a stub article."
+
+
+class StubWikipedia:
+    """
+    In-process fake of the `wikipedia` module with a fixed per-request latency.
+    """
+
+    def __init__(self, latency=LATENCY):
+        self.latency = latency
+        self.requests = 0
+
+    def request(self):
+        self.requests += 1
+        time.sleep(self.latency)
+
+    def search(self, query, results=10):
+        self.request()
+        # The first hit is specific to the query; the rest come from a small
+        # shared pool, so different queries overlap like real searches do
+        offset = sum(map(ord, query))
+        shared = [f"Topic {(offset + i) % 8}" for i in range(results - 1)]
+        return [query.title()] + shared
+
+    def page(self, title, auto_suggest=True):
+        self.request()
+        return StubPage(self, title)
+
+    def as_module(self):
+        module = types.ModuleType("wikipedia")
+        module.search = self.search
+        module.page = self.page
+        module.exceptions = types.SimpleNamespace(
+            DisambiguationError=DisambiguationError,
+            PageError=PageError
+        )
+        return module
+
+
+def install_stub(latency=LATENCY):
+    """
+    Replace the `wikipedia` module with a stub. Must run before importing
+    wikipedia_enhanced.
+    """
+    stub = StubWikipedia(latency)
+    sys.modules["wikipedia"] = stub.as_module()
+    return stub
+
+
+def mock_api_response(params):
+    """
+    Answer the MediaWiki API queries made by the `wikipedia` package
+    (formatversion 1) and by wikipedia_async (formatversion 2).
+    """
+    if params.get("list") == "search":
+        query = params["srsearch"]
+        limit = int(params.get("srlimit", 10))
+        hits = [{"title": f"{query.title()} {i}"} for i in range(1, limit + 1)]
+        return {"query": {"search": hits, "searchinfo": {}}}
+
+    title = params["titles"]
+    pageid = str(zlib.crc32(title.encode("utf-8")))
+    summary = f"{title} is a mock article."
+    content = summary + "\n\n\n== History ==\n" + f"{title} content. " * 2000
+    page = {
+        "pageid": pageid,
+        "title": title,
+        "fullurl": f"https://en.wikipedia.org/wiki/{title}",
+        "extract": summary if "exintro" in params else content,
+        "revisions": [{"revid": 1, "parentid": 0}]
+    }
+
+    if params.get("formatversion") == "2":
+        return {"query": {"pages": [page]}}
+    return {"query": {"pages": {pageid: page}}}
+
+
+class MockMediaWikiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Allow keep-alive
+
+    def setup(self):
+        super().setup()
+        # Don't let Nagle's algorithm hold back multi-write responses
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        params = dict(parse_qsl(urlsplit(self.path).query, keep_blank_values=True))
+        body = json.dumps(mock_api_response(params)).encode("utf-8")
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def timed(label, func, rounds=ROUNDS):
+    start = time.perf_counter()
+    for i in range(rounds):
+        func(i)
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{label:<40} {elapsed * 1000:8.1f} ms/lookup")
+    return elapsed
+
+
+def main():
+    stub = install_stub()
+    import wikipedia_enhanced
+
+    print(f"Stub latency: {LATENCY * 1000:.0f} ms per request, {ROUNDS} rounds")
+    print("=" * 60)
+
+    sequential = timed(
+        "get_article (sequential)",
+        lambda i: wikipedia_enhanced.get_article(f"term {i}", use_cache=False)
+    )
+    parallel = timed(
+        "get_article (parallel=True)",
+        lambda i: wikipedia_enhanced.get_article(f"term {i}", parallel=True, use_cache=False)
+    )
+    print(f"Speed-up: {sequential / parallel:.1f}x ({stub.requests} stub requests)")
+
+    wikipedia_enhanced.get_article("artificial intelligence")
+    before = stub.requests
+    timed(
+        "get_article (warm cache)",
+        lambda i: wikipedia_enhanced.get_article("Artificial  Intelligence")
+    )
+    cache = wikipedia_enhanced.article_cache
+    print(f"Warm cache: {stub.requests - before} stub requests, "
+          f"hit rate {cache.hit_rate():.0%} {cache.stats}")
+
+    print()
+    print(f"Batch of {BATCH_TERMS} terms")
+    print("=" * 60)
+    terms = [f"batch term {i}" for i in range(BATCH_TERMS)]
+
+    def per_term(parallel):
+        for term in terms:
+            wikipedia_enhanced.get_article(term, parallel=parallel, use_cache=False)
+
+    def batch():
+        wikipedia_enhanced.get_articles_batch(terms, use_cache=False)
+
+    for label, func in [
+        ("get_article loop (sequential)", lambda: per_term(False)),
+        ("get_article loop (parallel=True)", lambda: per_term(True)),
+        ("get_articles_batch", batch),
+    ]:
+        before = stub.requests
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<40} {BATCH_TERMS / elapsed:8.1f} terms/s "
+              f"({stub.requests - before} stub requests)")
+
+
+def main_async():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockMediaWikiHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_port}/w/api.php"
+
+    import wikipedia
+    import wikipedia_async
+    import wikipedia_enhanced
+
+    wikipedia.wikipedia.API_URL = api_url
+    wikipedia_async.API_URL = api_url
+    terms = [f"async term {i}" for i in range(BATCH_TERMS)]
+
+    print(f"Mock MediaWiki latency: {LATENCY * 1000:.0f} ms per request, {BATCH_TERMS} terms")
+    print("=" * 60)
+
+    def report(label, elapsed):
+        print(f"{label:<40} {elapsed / BATCH_TERMS * 1000:8.1f} ms/lookup "
+              f"{BATCH_TERMS / elapsed:8.1f} terms/s")
+
+    start = time.perf_counter()
+    for term in terms:
+        wikipedia_enhanced.get_article(term, use_cache=False)
+    report("get_article (wikipedia package)", time.perf_counter() - start)
+
+    async def one_at_a_time():
+        for term in terms:
+            await wikipedia_async.aget_article(term, use_cache=False)
+
+    async def all_at_once():
+        await asyncio.gather(*(wikipedia_async.aget_article(term, use_cache=False) for term in terms))
+
+    async def run():
+        for label, func in [
+            ("aget_article (awaited in turn)", one_at_a_time),
+            ("aget_article (gathered)", all_at_once),
+        ]:
+            start = time.perf_counter()
+            await func()
+            report(label, time.perf_counter() - start)
+        await wikipedia_async.aclose()
+
+    asyncio.run(run())
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["async"]:
+        main_async()
+    else:
+        main()
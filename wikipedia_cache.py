@@ -0,0 +1,181 @@
+"""
+Two-tier cache for wikipedia_enhanced lookups.
+
+Tier 1 is an in-memory LRU. Tier 2 is an optional SQLite file holding
+zlib-compressed JSON blobs, bounded by total size and evicted least recently
+used first. Both tiers expire entries after a TTL.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+
+DEFAULT_TTL = 24 * 60 * 60  # Wikipedia articles change slowly
+DEFAULT_MEMORY_ENTRIES = 256
+DEFAULT_DISK_BYTES = 64 * 1024 * 1024
+
+
+def normalize_term(search_term):
+    """
+    Normalize a search term so "Artificial  Intelligence" and
+    "artificial intelligence" share a cache entry.
+    """
+    return " ".join(search_term.split()).casefold()
+
+
+class ArticleCache:
+    """
+    Cache for search results (keyed by normalized search term) and
+    articles (keyed by page title).
+
+    Args:
+        path (str): SQLite file for the persistent tier, or None for memory only
+        ttl (float): Seconds before an entry expires
+        memory_entries (int): Maximum entries kept in the in-memory LRU
+        disk_bytes (int): Maximum compressed bytes kept in the persistent tier
+    """
+
+    def __init__(self, path=None, ttl=DEFAULT_TTL,
+                 memory_entries=DEFAULT_MEMORY_ENTRIES, disk_bytes=DEFAULT_DISK_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.memory_entries = memory_entries
+        self.disk_bytes = disk_bytes
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        self._memory = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()  # get_article(parallel=True) stores from worker threads
+        self._db = None
+
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+            self._db.commit()
+
+    # Public API
+
+    def get_search(self, search_term, results):
+        """
+        Returns the cached list of up to `results` titles for a search term, or None.
+        """
+        return self._get(f"search:{results}:{normalize_term(search_term)}")
+
+    def put_search(self, search_term, results, titles):
+        self._put(f"search:{results}:{normalize_term(search_term)}", list(titles))
+
+    def get_article(self, title):
+        """
+        Returns the cached article dict for a page title, or None.
+        """
+        return self._get(f"page:{title}")
+
+    def put_article(self, title, article):
+        self._put(f"page:{title}", article)
+
+    def hit_rate(self):
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        total = hits + self.stats["misses"]
+        return hits / total if total else 0.0
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM entries")
+                self._db.commit()
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # Tiers
+
+    def _get(self, key):
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    blob, expires_at = row
+                    if expires_at > now:
+                        self._db.execute(
+                            "UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key)
+                        )
+                        self._db.commit()
+                        value = json.loads(zlib.decompress(blob))
+                        self._remember(key, expires_at, value)
+                        self.stats["disk_hits"] += 1
+                        return value
+                    self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._db.commit()
+
+            self.stats["misses"] += 1
+            return None
+
+    def _put(self, key, value):
+        now = time.time()
+        expires_at = now + self.ttl
+
+        with self._lock:
+            self._remember(key, expires_at, value)
+
+            if self._db is not None:
+                blob = zlib.compress(json.dumps(value).encode("utf-8"))
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, blob, len(blob), expires_at, now)
+                )
+                self._evict_disk(now)
+                self._db.commit()
+
+    def _remember(self, key, expires_at, value):
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _evict_disk(self, now):
+        """
+        Drop expired rows, then least recently used rows until under disk_bytes.
+        """
+        self._db.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.disk_bytes:
+            return
+
+        rows = self._db.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.disk_bytes:
+                break
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            self.stats["evictions"] += 1
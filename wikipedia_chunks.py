@@ -0,0 +1,189 @@
+"""
+Token-budgeted chunk selection for retrieved Wikipedia articles.
+
+Article content is split into chunks along section headings ("== History ==")
+and paragraphs, scored against the search term with BM25, and the best chunks
+that fit a token budget are kept, in document order. The chunk index of each
+article (term frequencies, document frequencies, token counts) is built once
+and cached, so later queries against the same article only pay for scoring.
+"""
+
+import math
+import re
+from collections import Counter, namedtuple
+from functools import lru_cache
+
+
+DEFAULT_TOKEN_BUDGET = 1000
+MAX_CHUNK_TOKENS = 200  # Longer paragraphs are split into windows of about this size
+INDEX_CACHE_SIZE = 64
+
+# BM25 parameters
+K1 = 1.5
+B = 0.75
+
+_HEADING = re.compile(r"^(={2,})\s*(.*?)\s*\1$")
+_WORD = re.compile(r"\w+")
+
+Chunk = namedtuple("Chunk", ["position", "section", "text", "tokens"])
+
+
+def estimate_tokens(text):
+    """
+    Rough token count for English text, at about 4 characters per token.
+    Pass a real tokenizer's count as count_tokens where accuracy matters.
+    """
+    return max(1, (len(text) + 3) // 4)
+
+
+def _terms(text):
+    return _WORD.findall(text.casefold())
+
+
+def _split_long(paragraph):
+    """
+    Split a paragraph of more than MAX_CHUNK_TOKENS into word windows.
+    """
+    if estimate_tokens(paragraph) <= MAX_CHUNK_TOKENS:
+        return [paragraph]
+
+    words = paragraph.split()
+    window = MAX_CHUNK_TOKENS * 3 // 4  # ~0.75 words per token
+    return [" ".join(words[i:i + window]) for i in range(0, len(words), window)]
+
+
+def split_chunks(content):
+    """
+    Split article content into Chunks by section heading and paragraph.
+    """
+    chunks = []
+    section = ""
+
+    for line in content.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+
+        heading = _HEADING.match(line)
+        if heading:
+            section = heading.group(2)
+            continue
+
+        for text in _split_long(line):
+            chunks.append(Chunk(len(chunks), section, text, estimate_tokens(text)))
+
+    return chunks
+
+
+class ChunkIndex:
+    """
+    BM25 index over the chunks of one article.
+    """
+
+    __slots__ = ('chunks', '_term_freqs', '_lengths', '_average_length', '_idf')
+
+    def __init__(self, content):
+        self.chunks = split_chunks(content)
+        self._term_freqs = []
+        self._lengths = []
+        doc_freqs = Counter()
+
+        for chunk in self.chunks:
+            freqs = Counter(_terms(chunk.text))
+            self._term_freqs.append(freqs)
+            self._lengths.append(sum(freqs.values()))
+            doc_freqs.update(freqs.keys())
+
+        count = len(self.chunks)
+        self._average_length = sum(self._lengths) / count if count else 0.0
+        self._idf = {
+            term: math.log(1 + (count - freq + 0.5) / (freq + 0.5))
+            for term, freq in doc_freqs.items()
+        }
+
+    def scores(self, query):
+        """
+        Returns the BM25 score of every chunk for a query, in chunk order.
+        """
+        terms = [term for term in set(_terms(query)) if term in self._idf]
+        scores = [0.0] * len(self.chunks)
+        if not terms:
+            return scores
+
+        for i, (freqs, length) in enumerate(zip(self._term_freqs, self._lengths)):
+            norm = K1 * (1 - B + B * length / self._average_length)
+            score = 0.0
+            for term in terms:
+                freq = freqs.get(term)
+                if freq:
+                    score += self._idf[term] * freq * (K1 + 1) / (freq + norm)
+            scores[i] = score
+
+        return scores
+
+
+@lru_cache(maxsize=INDEX_CACHE_SIZE)
+def chunk_index(title, content):
+    """
+    Returns the cached ChunkIndex for an article. Python caches string hashes,
+    so repeat lookups with the same content string are cheap.
+    """
+    return ChunkIndex(content)
+
+
+def select_chunks(article, query, token_budget=DEFAULT_TOKEN_BUDGET, top_k=None,
+                  count_tokens=None):
+    """
+    Pick the chunks of an article that best match a query within a token budget.
+
+    Args:
+        article (dict): Article with 'title' and 'content', as from get_article
+        query (str): Text to score chunks against, usually the search term
+        token_budget (int): Maximum total tokens of the selected chunks
+        top_k (int): Maximum number of chunks, or None for no limit
+        count_tokens (callable): Token counter for a string; defaults to
+                                 estimate_tokens
+
+    Returns:
+        list: Selected Chunks in document order. Only matching chunks are
+              used; with no matching terms at all the leading chunks are
+              used, since articles open with a summary.
+    """
+    index = chunk_index(article['title'], article['content'])
+    scores = index.scores(query)
+    ranked = sorted(range(len(index.chunks)), key=lambda i: (-scores[i], i))
+    if any(scores):
+        ranked = [i for i in ranked if scores[i] > 0]
+
+    selected = []
+    used = 0
+    for i in ranked:
+        if top_k is not None and len(selected) >= top_k:
+            break
+        chunk = index.chunks[i]
+        tokens = chunk.tokens if count_tokens is None else count_tokens(chunk.text)
+        if used + tokens > token_budget:
+            continue  # A smaller chunk further down may still fit
+        selected.append(chunk)
+        used += tokens
+
+    return sorted(selected, key=lambda chunk: chunk.position)
+
+
+def fit_content(article, query, token_budget=DEFAULT_TOKEN_BUDGET, top_k=None,
+                count_tokens=None):
+    """
+    Returns the article content cut down to its best chunks for a query,
+    with section headings kept so the text still reads as an article.
+    The headings are not counted against token_budget.
+    """
+    lines = []
+    section = ""
+
+    for chunk in select_chunks(article, query, token_budget, top_k, count_tokens):
+        if chunk.section != section:
+            section = chunk.section
+            lines.append(f"== {section} ==")
+        lines.append(chunk.text)
+
+    return "\n\n".join(lines)
@@ -1,96 +1,692 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+
 import wikipedia
 
-def get_article(search_term):
+from wikipedia_cache import ArticleCache
+from wikipedia_chunks import fit_content
+
+
+MAX_RESULTS = 3
+DEFAULT_MAX_WORKERS = 6  # Enough for page + content + summary of 2 results at once
+DEFAULT_BATCH_WORKERS = 16
+
+class WikipediaBackend:
+    """
+    Live Wikipedia API via the `wikipedia` package.
+
+    Any object with the same search() and page() methods can replace it as
+    the module's backend, e.g. wikipedia_local.LocalWikipediaBackend. Pages
+    need title, content and summary attributes, and page() raises
+    wikipedia.exceptions.PageError or DisambiguationError on failure.
+    """
+
+    def search(self, query, results):
+        return wikipedia.search(query, results=results)
+
+    def page(self, title):
+        return wikipedia.page(title, auto_suggest=False)
+
+
+# Where searches and pages come from. To work offline use e.g.
+#   wikipedia_enhanced.backend = LocalWikipediaBackend("wiki_index")
+backend = WikipediaBackend()
+
+# Shared cache for all lookups. Memory only by default; for a persistent cache use e.g.
+#   wikipedia_enhanced.article_cache = ArticleCache(path="wikipedia_cache.sqlite3")
+article_cache = ArticleCache()
+
+# Optional metrics sink, see wikipedia_metrics. While None, instrumentation
+# costs a single check per event.
+metrics = None
+
+ARTICLE_FIELDS = ('title', 'content', 'description')
+PAGE_ATTRIBUTES = {'content': 'content', 'description': 'summary'}  # Lazy requests on a page
+
+
+class _Coalescer:
+    """
+    Lets concurrent callers asking for the same key share one in-flight call
+    instead of each making their own request.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+    def run(self, key, func, *args, **kwargs):
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+_requests = _Coalescer()
+
+
+def _timed(span, func, *args):
+    """
+    Call func, recording its duration as a span when metrics are on.
+    """
+    sink = metrics
+    if sink is None:
+        return func(*args)
+
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        sink.observe(span, time.perf_counter() - start)
+
+
+def _count(counter):
+    sink = metrics
+    if sink is not None:
+        sink.increment(counter)
+
+
+def _get_page(title):
+    return _requests.run(('page', title), _timed, 'page', backend.page, title)
+
+
+def _load_field(page, field):
+    attribute = PAGE_ATTRIBUTES[field]
+    return _requests.run((page.title, field), _timed, attribute, getattr, page, attribute)
+
+
+def _cached_article(result):
+    article = article_cache.get_article(result)
+    _count('cache_hits' if article is not None else 'cache_misses')
+    return article
+
+
+class Article:
+    """
+    A Wikipedia article whose content and description are only downloaded
+    when first accessed. Supports article['title'] style access, like the
+    dicts returned by get_article.
+    """
+
+    __slots__ = ('title', '_page', '_content', '_description')
+
+    def __init__(self, title, page=None, content=None, description=None):
+        self.title = title
+        self._page = page
+        self._content = content
+        self._description = description
+
+    @classmethod
+    def from_dict(cls, article):
+        return cls(article['title'], content=article['content'], description=article['description'])
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = _load_field(self._page, 'content')
+            self._release_page()
+        return self._content
+
+    @property
+    def description(self):
+        if self._description is None:
+            self._description = _load_field(self._page, 'description')  # Using summary as description
+            self._release_page()
+        return self._description
+
+    def is_loaded(self):
+        """
+        True once every field has been fetched.
+        """
+        return self._content is not None and self._description is not None
+
+    def to_dict(self):
+        """
+        Fetch any remaining fields and return a plain dict.
+        """
+        return {field: getattr(self, field) for field in ARTICLE_FIELDS}
+
+    def _release_page(self):
+        # Nothing left to load, so let the page object go
+        if self.is_loaded():
+            self._page = None
+
+    def __getitem__(self, key):
+        if key not in ARTICLE_FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def keys(self):
+        return ARTICLE_FIELDS
+
+    def __repr__(self):
+        return f"Article(title={self.title!r}, loaded={self.is_loaded()})"
+
+
+class _SeenTitles:
+    """
+    Titles of the pages fetched so far. Worker threads check it while the
+    thread collecting their results adds to it.
+    """
+
+    def __init__(self, titles=None):
+        self._titles = set() if titles is None else titles  # Shared, not copied
+        self._lock = threading.Lock()
+
+    def add(self, title):
+        with self._lock:
+            self._titles.add(title)
+
+    def __contains__(self, title):
+        with self._lock:
+            return title in self._titles
+
+
+class _SeenPage:
+    """
+    Stands in for a page already fetched for another result; only its title is known.
+    """
+
+    __slots__ = ('title',)
+
+    def __init__(self, title):
+        self.title = title
+
+
+def _resolve_page(result, seen=()):
+    """
+    Fetch the Wikipedia page for a search result.
+
+    Disambiguation pages fall back to their first option. A result (or
+    fallback) naming a page already in seen is not fetched again; a _SeenPage
+    with its title is returned instead. Returns None when the result should
+    be skipped; any other error is raised to the caller.
+    """
+    if result in seen:
+        return _SeenPage(result)
+
+    try:
+        return _get_page(result)
+    except wikipedia.exceptions.DisambiguationError as e:
+        # Handle disambiguation pages by taking the first option,
+        # unless another result already fetched it
+        _count('disambiguations')
+        try:
+            if e.options[0] in seen:
+                return _SeenPage(e.options[0])
+            return _get_page(e.options[0])
+        except:
+            # Skip this result if it still fails
+            _count('skips')
+            return None
+    except wikipedia.exceptions.PageError:
+        # Skip results that don't have valid pages
+        _count('skips')
+        return None
+
+
+def _fetch_articles_sequential(results, fields=ARTICLE_FIELDS, seen=None):
+    """
+    Fetch articles one at a time, in search order, downloading only the
+    requested fields up front.
+
+    seen is the set of page titles already fetched; it is updated in place
+    and results resolving to one of them are skipped as duplicates.
+
+    Returns a dict of search result -> Article for the results that resolved.
+    """
+    articles = {}
+    seen = set() if seen is None else seen
+
+    for result in results:
+        try:
+            page = _resolve_page(result, seen)
+            if page is None:
+                continue
+            if page.title in seen:
+                _count('skips')
+                continue
+            seen.add(page.title)
+
+            # Extract information
+            values = {
+                field: _load_field(page, field)
+                for field in fields if field in PAGE_ATTRIBUTES
+            }
+            articles[result] = Article(page.title, page, **values)
+
+        except Exception as e:
+            # Skip any other errors and continue with next result
+            _count('errors')
+            print(f"Error processing result '{result}': {e}")
+            continue
+
+    return articles
+
+
+class _ParallelFetch:
+    """
+    Concurrent page and field fetches on a shared thread pool.
+
+    Every page is requested as soon as it is added; as soon as a page
+    resolves, each requested field (content, summary) is fetched as another
+    independent task. No task waits on another, so a small pool cannot
+    deadlock. Callers may submit other stages (e.g. searches) and handle them
+    in run()'s on_done callback, which may add more pages.
+
+    A page whose title is in seen, or was resolved by an earlier task, is not
+    fetched again, even as a disambiguation fallback; its search result is
+    recorded in aliases instead.
+    """
+
+    def __init__(self, executor, fields=ARTICLE_FIELDS, seen=None):
+        self.executor = executor
+        self.lazy_fields = [field for field in fields if field in PAGE_ATTRIBUTES]
+        self.seen = _SeenTitles(seen)  # Also read by _resolve_page on worker threads
+        self.pages = {}  # search result -> page
+        self.values = {}  # search result -> {field: value}
+        self.aliases = {}  # search result -> canonical title fetched for another result
+        self.failed = set()
+        self.pending = {}  # future -> (key, stage)
+
+    def add(self, result):
+        if result in self.values:
+            return
+        self.values[result] = {}
+        self.submit(result, 'page', _resolve_page, result, self.seen)
+
+    def submit(self, key, stage, func, *args):
+        self.pending[self.executor.submit(func, *args)] = (key, stage)
+
+    def run(self, deadline=None, on_done=None):
+        """
+        Process finished tasks until none are pending or the deadline passes.
+        """
+        while self.pending:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+
+            done, _ = wait(self.pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                key, stage = self.pending.pop(future)
+                if stage == 'page' or stage in PAGE_ATTRIBUTES:
+                    self._handle(key, stage, future)
+                else:
+                    on_done(key, stage, future)
+
+    def articles(self):
+        """
+        Returns a dict of search result -> Article for the results that
+        completed.
+        """
+        return {
+            result: Article(page.title, page, **self.values[result])
+            for result, page in self.pages.items()
+            if result not in self.failed and len(self.values[result]) == len(self.lazy_fields)
+        }
+
+    def _handle(self, result, stage, future):
+        if result in self.failed:
+            return
+
+        try:
+            value = future.result()
+        except Exception as e:
+            _count('errors')
+            print(f"Error processing result '{result}': {e}")
+            self.failed.add(result)
+            return
+
+        if stage != 'page':
+            self.values[result][stage] = value
+        elif value is None:
+            self.failed.add(result)
+        elif value.title in self.seen:
+            _count('skips')
+            self.aliases[result] = value.title
+        else:
+            self.seen.add(value.title)
+            self.pages[result] = value
+            for field in self.lazy_fields:
+                self.submit(result, field, _load_field, value, field)
+
+
+def _fetch_articles_parallel(results, max_workers, overall_timeout, fields=ARTICLE_FIELDS, seen=None):
+    """
+    Fetch articles concurrently on a thread pool. overall_timeout is one
+    deadline for all of them, counted from now: time a task spends queued
+    behind others counts against it. Articles that are not complete when it
+    passes are dropped, as are results resolving to a page in seen or to one
+    fetched for an earlier result.
+
+    Returns a dict of search result -> Article for the results that resolved.
+    """
+    deadline = None if overall_timeout is None else time.monotonic() + overall_timeout
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        fetch = _ParallelFetch(executor, fields, seen)
+        for result in results:
+            fetch.add(result)
+        fetch.run(deadline)
+    finally:
+        # Don't block on stragglers past the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return fetch.articles()
+
+
+def _search(search_term, use_cache, max_results=MAX_RESULTS):
+    """
+    Returns the top search result titles, from the cache when possible.
+    """
+    if use_cache:
+        results = article_cache.get_search(search_term, max_results)
+        _count('cache_hits' if results is not None else 'cache_misses')
+        if results is not None:
+            return results
+
+    results = _timed('search', backend.search, search_term, max_results)[:max_results]
+
+    if use_cache:
+        article_cache.put_search(search_term, max_results, results)
+    return results
+
+
+def _cache_article(result, article):
+    """
+    Store an article under its search result and, after a disambiguation
+    fallback, under its canonical title too.
+    """
+    article_cache.put_article(result, article)
+    if article['title'] != result:
+        article_cache.put_article(article['title'], article)
+
+
+def _unique_by_title(articles):
+    """
+    Drop articles whose canonical title has already appeared.
+    """
+    unique = {}
+    for article in articles:
+        unique.setdefault(article['title'], article)
+    return list(unique.values())
+
+
+def get_article(search_term, parallel=False, max_workers=DEFAULT_MAX_WORKERS, timeout=None,
+                use_cache=True, fields=None, token_budget=None):
     """
-    Enhanced Wikipedia function that returns content, title, and description 
+    Enhanced Wikipedia function that returns content, title, and description
     for the top 3 search results.
-    
+
     Args:
         search_term (str): The term to search for on Wikipedia
-        
+        parallel (bool): Fetch pages, content and summaries concurrently
+                         instead of one request at a time
+        max_workers (int): Maximum concurrent requests when parallel=True
+        timeout (float): Overall deadline in seconds for fetching the
+                         articles when parallel=True, counted from when the
+                         fetches start (not per article); articles unfinished
+                         by then are dropped. None waits for all of them.
+        use_cache (bool): Serve search results and articles from article_cache
+                          and store anything newly fetched
+        fields (tuple): Fields to download up front, e.g. ('title', 'description').
+                        When given, Article objects are returned and any other
+                        field is only fetched when accessed. None downloads
+                        everything and returns plain dicts.
+        token_budget (int): When set (and fields is None), each article's
+                            'content' is cut down to the sections and
+                            paragraphs most relevant to search_term that fit
+                            in this many tokens
+
     Returns:
-        list: A list of dictionaries containing 'title', 'content', and 'description' 
-              for up to 3 Wikipedia articles
+        list: A list of dictionaries (or Articles, see fields) containing 'title',
+              'content', and 'description' for up to 3 Wikipedia articles,
+              in search order
     """
     try:
         # Get search results
-        results = wikipedia.search(search_term, results=3)
-        
+        results = _search(search_term, use_cache)
+
         if not results:
             return []
-        
-        articles = []
-        
-        # Process up to 3 results
-        for result in results[:3]:
-            try:
-                # Get the Wikipedia page
-                page = wikipedia.page(result, auto_suggest=False)
-                
-                # Extract information
-                article_info = {
-                    'title': page.title,
-                    'content': page.content,
-                    'description': page.summary  # Using summary as description
-                }
-                
-                articles.append(article_info)
-                
-            except wikipedia.exceptions.DisambiguationError as e:
-                # Handle disambiguation pages by taking the first option
-                try:
-                    page = wikipedia.page(e.options[0], auto_suggest=False)
-                    article_info = {
-                        'title': page.title,
-                        'content': page.content,
-                        'description': page.summary
-                    }
-                    articles.append(article_info)
-                except:
-                    # Skip this result if it still fails
-                    continue
-                    
-            except wikipedia.exceptions.PageError:
-                # Skip results that don't have valid pages
-                continue
-            except Exception as e:
-                # Skip any other errors and continue with next result
-                print(f"Error processing result '{result}': {e}")
-                continue
-        
+
+        cached = {}
+        if use_cache:
+            for result in results:
+                article = _cached_article(result)
+                if article is not None:
+                    cached[result] = Article.from_dict(article)
+
+        # Process up to 3 results, never fetching a page we already have
+        selected = ARTICLE_FIELDS if fields is None else tuple(fields)
+        seen = {article.title for article in cached.values()}
+        missing = [result for result in results if result not in cached]
+        if not missing:
+            fetched = {}
+        elif parallel:
+            fetched = _fetch_articles_parallel(missing, max_workers, timeout, selected, seen)
+        else:
+            fetched = _fetch_articles_sequential(missing, selected, seen)
+
+        if use_cache:
+            for result, article in fetched.items():
+                # Partially loaded articles aren't worth a cache entry
+                if article.is_loaded():
+                    _cache_article(result, article.to_dict())
+
+        articles = {**cached, **fetched}
+        ordered = _unique_by_title(articles[result] for result in results if result in articles)
+        if fields is not None:
+            return ordered
+
+        articles = [article.to_dict() for article in ordered]
+        if token_budget is not None:
+            for article in articles:
+                article['content'] = fit_content(article, search_term, token_budget)
         return articles
-        
+
     except Exception as e:
+        _count('errors')
         print(f"Error searching Wikipedia: {e}")
         return []
 
 
-def get_article_compact(search_term):
+def get_articles_batch(terms, max_workers=DEFAULT_BATCH_WORKERS, results_per_term=MAX_RESULTS,
+                       timeout=None, use_cache=True, fields=None):
+    """
+    Look up many search terms at once.
+
+    All searches and page fetches share one thread pool and are pipelined:
+    a term's pages are requested as soon as its search returns, without
+    waiting for the other searches. A page shared by several terms is only
+    fetched once.
+
+    Args:
+        terms (list): Search terms to look up
+        max_workers (int): Maximum concurrent requests for the whole batch
+        results_per_term (int): Search results to fetch for each term
+        timeout (float): Deadline in seconds for the whole batch; unfinished
+                         articles are dropped. None waits for all of them.
+        use_cache (bool): Serve search results and articles from article_cache
+                          and store anything newly fetched
+        fields (tuple): Fields to download up front, as for get_article
+
+    Returns:
+        dict: Search term -> list of articles, in the same form as get_article
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    selected = ARTICLE_FIELDS if fields is None else tuple(fields)
+    searches = {}  # term -> search results
+    cached = {}  # search result -> Article
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        fetch = _ParallelFetch(executor, selected)
+
+        def on_search(term, stage, future):
+            try:
+                searches[term] = future.result()
+            except Exception as e:
+                _count('errors')
+                print(f"Error searching Wikipedia: {e}")
+                searches[term] = []
+
+            for result in searches[term]:
+                if result in cached or result in fetch.values:
+                    continue
+                article = _cached_article(result) if use_cache else None
+                if article is not None:
+                    cached[result] = Article.from_dict(article)
+                    fetch.seen.add(article['title'])
+                else:
+                    fetch.add(result)
+
+        for term in dict.fromkeys(terms):
+            fetch.submit(term, 'search', _search, term, use_cache, results_per_term)
+        fetch.run(deadline, on_search)
+    finally:
+        # Don't block on stragglers past the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    fetched = fetch.articles()
+    if use_cache:
+        for result, article in fetched.items():
+            if article.is_loaded():
+                _cache_article(result, article.to_dict())
+
+    articles = {**cached, **fetched}
+    by_title = {article.title: article for article in articles.values()}
+    for result, title in fetch.aliases.items():
+        if title in by_title:
+            articles[result] = by_title[title]
+
+    batch = {}
+    for term in terms:
+        ordered = _unique_by_title(
+            articles[result] for result in searches.get(term, []) if result in articles
+        )
+        batch[term] = [article.to_dict() for article in ordered] if fields is None else ordered
+    return batch
+
+
+def _iter_chunks(text, chunk_size):
+    """
+    Split text into pieces of at most chunk_size characters, breaking at the
+    last newline in each window when there is one.
+    """
+    start = 0
+    while start < len(text):
+        end = start + chunk_size
+        if end < len(text):
+            newline = text.rfind("\n", start, end)
+            if newline > start:
+                end = newline + 1
+        yield text[start:end]
+        start = end
+
+
+def iter_articles(search_term, chunk_size=None, use_cache=True):
+    """
+    Generator version of get_article that yields each article as soon as it
+    has been fetched, so callers can start on the first article while the
+    rest are still to come. The next article is only fetched when asked for,
+    so just one article is held at a time (plus whatever article_cache keeps;
+    pass use_cache=False for a strict bound).
+
+    Args:
+        search_term (str): The term to search for on Wikipedia
+        chunk_size (int): When set, 'content' is an iterator of strings of at
+                          most chunk_size characters instead of one string
+        use_cache (bool): Serve and store results through article_cache
+
+    Yields:
+        dict: 'title', 'content', and 'description' for each of up to 3
+              Wikipedia articles, in search order
+    """
+    try:
+        results = _search(search_term, use_cache)
+    except Exception as e:
+        _count('errors')
+        print(f"Error searching Wikipedia: {e}")
+        return
+
+    seen = set()
+
+    for result in results:
+        article = _cached_article(result) if use_cache else None
+
+        if article is None:
+            article = _fetch_articles_sequential([result], seen=seen).get(result)
+            if article is None:
+                continue
+            article = article.to_dict()
+            if use_cache:
+                _cache_article(result, article)
+        elif article['title'] in seen:
+            continue
+        seen.add(article['title'])
+
+        # A copy either way, so callers can't change what article_cache holds
+        if chunk_size:
+            article = {**article, 'content': _iter_chunks(article['content'], chunk_size)}
+        else:
+            article = dict(article)
+
+        yield article
+
+
+def get_article_compact(search_term, use_cache=True):
     """
     Compact version that returns essential info for top 3 results.
-    
+
     Args:
         search_term (str): The term to search for on Wikipedia
-        
+        use_cache (bool): Serve and store results through article_cache
+
     Returns:
         list: A list of dictionaries with 'title', 'content', and 'description'
     """
     try:
-        results = wikipedia.search(search_term, results=3)
+        results = _search(search_term, use_cache)
         articles = []
-        
-        for result in results[:3]:
+
+        for result in results:
             try:
-                page = wikipedia.page(result, auto_suggest=False)
-                articles.append({
-                    'title': page.title,
-                    'content': page.content,
-                    'description': page.summary
-                })
+                article = _cached_article(result) if use_cache else None
+                if article is None:
+                    page = _get_page(result)
+                    article = {
+                        'title': page.title,
+                        'content': _load_field(page, 'content'),
+                        'description': _load_field(page, 'description')
+                    }
+                    if use_cache:
+                        _cache_article(result, article)
+                articles.append(dict(article))  # Never hand out the cache's own dict
             except:
                 continue
-                
-        return articles
+
+        return _unique_by_title(articles)
     except:
         return []
 
@@ -101,9 +697,9 @@ if __name__ == "__main__":
     search_term = "artificial intelligence"
     print(f"Searching for: {search_term}")
     print("=" * 50)
-    
+
     articles = get_article(search_term)
-    
+
     for i, article in enumerate(articles, 1):
         print(f"\n--- Article {i} ---")
         print(f"Title: {article['title']}")
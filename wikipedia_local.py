@@ -0,0 +1,211 @@
+"""
+Offline Wikipedia backend for wikipedia_enhanced.
+
+An index directory holds two files:
+- index.sqlite3: article offsets plus a contentless SQLite FTS5 full-text index
+- articles.bin: every summary and content as UTF-8, memory-mapped for reads
+
+Build one from a pre-fetched corpus, then plug it in:
+
+    import wikipedia_enhanced
+    from wikipedia_local import LocalWikipediaBackend
+
+    wikipedia_enhanced.backend = LocalWikipediaBackend("wiki_index")
+
+Usage:
+    python wikipedia_local.py corpus.jsonl wiki_index
+"""
+
+import json
+import mmap
+import os
+import sqlite3
+import sys
+import threading
+
+import wikipedia
+
+
+INDEX_FILE = "index.sqlite3"
+ARTICLES_FILE = "articles.bin"
+TITLE_WEIGHT = 10.0  # bm25 weight of a title match relative to a content match
+
+
+def _read_jsonl(path):
+    """
+    Yield article dicts from a JSON lines corpus with 'title', 'content' and
+    optionally 'description' on each line.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def build_index(path, articles):
+    """
+    Build an offline index directory from an iterable of article dicts, such
+    as the results of get_article or a JSON lines dump.
+
+    Args:
+        path (str): Directory to write the index to; created if missing
+        articles: Iterable of dicts with 'title', 'content' and optionally
+                  'description' (defaults to the first paragraph of content)
+
+    Returns:
+        int: Number of articles indexed
+    """
+    os.makedirs(path, exist_ok=True)
+    index_path = os.path.join(path, INDEX_FILE)
+    if os.path.exists(index_path):
+        os.remove(index_path)
+
+    db = sqlite3.connect(index_path)
+    db.executescript(
+        """
+        CREATE TABLE articles (
+            id INTEGER PRIMARY KEY,
+            title TEXT UNIQUE NOT NULL,
+            summary_offset INTEGER NOT NULL,
+            summary_length INTEGER NOT NULL,
+            content_offset INTEGER NOT NULL,
+            content_length INTEGER NOT NULL
+        );
+        CREATE VIRTUAL TABLE articles_fts USING fts5(title, content, content='');
+        """
+    )
+
+    count = 0
+    offset = 0
+    with open(os.path.join(path, ARTICLES_FILE), "wb") as blob:
+        for article in articles:
+            title = article["title"]
+            content = article["content"]
+            summary = article.get("description") or content.split("\n\n", 1)[0]
+
+            if db.execute("SELECT 1 FROM articles WHERE title = ?", (title,)).fetchone():
+                continue  # Keep the first copy of duplicate titles
+
+            summary_bytes = summary.encode("utf-8")
+            content_bytes = content.encode("utf-8")
+            blob.write(summary_bytes)
+            blob.write(content_bytes)
+
+            cursor = db.execute(
+                "INSERT INTO articles (title, summary_offset, summary_length, content_offset, content_length)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (title, offset, len(summary_bytes), offset + len(summary_bytes), len(content_bytes))
+            )
+            db.execute(
+                "INSERT INTO articles_fts (rowid, title, content) VALUES (?, ?, ?)",
+                (cursor.lastrowid, title, content)
+            )
+            offset += len(summary_bytes) + len(content_bytes)
+            count += 1
+
+    db.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+    db.commit()
+    db.close()
+    return count
+
+
+class LocalPage:
+    """
+    Page from a LocalWikipediaBackend. Like wikipedia.WikipediaPage, content
+    and summary are only read when accessed, here from the memory map.
+    """
+
+    __slots__ = ('title', '_backend', '_summary_span', '_content_span')
+
+    def __init__(self, backend, title, summary_span, content_span):
+        self.title = title
+        self._backend = backend
+        self._summary_span = summary_span
+        self._content_span = content_span
+
+    @property
+    def content(self):
+        return self._backend._read(*self._content_span)
+
+    @property
+    def summary(self):
+        return self._backend._read(*self._summary_span)
+
+
+class LocalWikipediaBackend:
+    """
+    Backend serving search and page lookups from an index built by
+    build_index, with no network access.
+
+    Args:
+        path (str): Index directory written by build_index
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()  # Lookups can come from worker threads
+        index_uri = f"file:{os.path.abspath(os.path.join(path, INDEX_FILE))}?mode=ro"
+        self._db = sqlite3.connect(index_uri, uri=True, check_same_thread=False)
+
+        self._file = open(os.path.join(path, ARTICLES_FILE), "rb")
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b""  # mmap can't map an empty file
+
+    def search(self, query, results):
+        """
+        Returns up to `results` titles matching any word of the query: an
+        exact title match first, then the best bm25 matches.
+        """
+        words = query.split()
+        if not words:
+            return []
+
+        match = " OR ".join('"{}"'.format(word.replace('"', '""')) for word in words)
+        with self._lock:
+            exact = self._db.execute(
+                "SELECT title FROM articles WHERE title = ? COLLATE NOCASE LIMIT 1",
+                (" ".join(words),)
+            ).fetchall()
+            rows = self._db.execute(
+                "SELECT articles.title FROM articles_fts"
+                " JOIN articles ON articles.id = articles_fts.rowid"
+                " WHERE articles_fts MATCH ?"
+                " ORDER BY bm25(articles_fts, ?, 1.0) LIMIT ?",
+                (match, TITLE_WEIGHT, results)
+            ).fetchall()
+
+        titles = [title for (title,) in exact + rows]
+        return list(dict.fromkeys(titles))[:results]
+
+    def page(self, title):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT summary_offset, summary_length, content_offset, content_length"
+                " FROM articles WHERE title = ?",
+                (title,)
+            ).fetchone()
+        if row is None:
+            raise wikipedia.exceptions.PageError(title)
+        return LocalPage(self, title, row[:2], row[2:])
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+            if isinstance(self._map, mmap.mmap):
+                self._map.close()
+            self._file.close()
+
+    def _read(self, offset, length):
+        return self._map[offset:offset + length].decode("utf-8")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python wikipedia_local.py <corpus.jsonl> <index_dir>")
+        sys.exit(1)
+
+    corpus_path, index_path = sys.argv[1:]
+    count = build_index(index_path, _read_jsonl(corpus_path))
+    print(f"Indexed {count} articles into {index_path}")
@@ -0,0 +1,127 @@
+"""
+Metrics sinks for wikipedia_enhanced.
+
+wikipedia_enhanced records timing spans ("search", "page", "content",
+"summary") and counters ("errors", "disambiguations", "skips", "cache_hits",
+"cache_misses") into its module-level `metrics` sink. It is None by default,
+which costs one attribute check per event. To turn metrics on:
+
+    import wikipedia_enhanced
+    from wikipedia_metrics import MemorySink
+
+    wikipedia_enhanced.metrics = MemorySink()
+    wikipedia_enhanced.get_article("artificial intelligence")
+    print(wikipedia_enhanced.metrics.prometheus_text())
+
+A sink is any object with observe(name, seconds) and increment(name, amount).
+"""
+
+import bisect
+import json
+import threading
+import time
+
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_PREFIX = "wikipedia_enhanced"
+
+
+class MemorySink:
+    """
+    Keeps a latency histogram per span and a total per counter in memory,
+    readable as a dict or in Prometheus text exposition format.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()  # Events arrive from worker threads
+        self._histograms = {}  # name -> [bucket counts..., +Inf count]
+        self._sums = {}
+        self._counters = {}
+
+    def observe(self, name, seconds):
+        with self._lock:
+            counts = self._histograms.get(name)
+            if counts is None:
+                counts = self._histograms[name] = [0] * (len(self.buckets) + 1)
+                self._sums[name] = 0.0
+            counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self._sums[name] += seconds
+
+    def increment(self, name, amount=1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self):
+        """
+        Returns counters and, per span, its count, total and mean seconds.
+        """
+        with self._lock:
+            spans = {}
+            for name, counts in self._histograms.items():
+                count = sum(counts)
+                spans[name] = {
+                    "count": count,
+                    "sum": self._sums[name],
+                    "mean": self._sums[name] / count
+                }
+            return {"spans": spans, "counters": dict(self._counters)}
+
+    def prometheus_text(self):
+        """
+        Render every span as a histogram and every counter as a counter in
+        Prometheus text exposition format.
+        """
+        lines = []
+        with self._lock:
+            for name, counts in sorted(self._histograms.items()):
+                metric = f"{PROMETHEUS_PREFIX}_{name}_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, count in zip(self.buckets, counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{le="{bound}"}} {cumulative}')
+                cumulative += counts[-1]
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {cumulative}')
+                lines.append(f"{metric}_sum {self._sums[name]}")
+                lines.append(f"{metric}_count {cumulative}")
+
+            for name, value in sorted(self._counters.items()):
+                metric = f"{PROMETHEUS_PREFIX}_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+
+        return "\n".join(lines) + "\n"
+
+
+class JsonLinesSink:
+    """
+    Appends one JSON object per event to a file, e.g.
+    {"type": "span", "name": "page", "seconds": 0.21, "time": 1760000000.0}
+
+    Args:
+        path (str): File to append to
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def observe(self, name, seconds):
+        self._write({"type": "span", "name": name, "seconds": seconds, "time": time.time()})
+
+    def increment(self, name, amount=1):
+        self._write({"type": "counter", "name": name, "amount": amount, "time": time.time()})
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def _write(self, event):
+        line = json.dumps(event) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()